@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-import re
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -11,7 +10,6 @@ from homeassistant.core import HomeAssistant
 
 
 from .const import (
-    DOMAIN,
     CONF_CONTROL_METHOD,
     CONF_COVER_ENTITY_ID,
     CONF_OPEN_SWITCH_ENTITY_ID,
@@ -21,73 +19,92 @@ from .const import (
     CONTROL_METHOD_EXISTING_COVER,
     CURRENT_CONFIG_VERSION,
 )
+from .util import slugify_name
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.COVER]
 
+_MigrationResult = tuple[dict[str, Any], str | None]
+
+
+def _migrate_1_to_2(
+    data: dict[str, Any], unique_id: str | None
+) -> _MigrationResult | None:
+    """Add name-based unique_id."""
+    name = data.get(CONF_NAME, "")
+    if not name:
+        _LOGGER.error("Migration failed: no name found in config")
+        return None
+    return data, slugify_name(name)
+
+
+def _migrate_2_to_3(
+    data: dict[str, Any], unique_id: str | None
+) -> _MigrationResult | None:
+    """Add control method."""
+    # Determine control method based on existing configuration
+    if data.get(CONF_COVER_ENTITY_ID):
+        data[CONF_CONTROL_METHOD] = CONTROL_METHOD_EXISTING_COVER
+    elif data.get(CONF_OPEN_SWITCH_ENTITY_ID) and data.get(CONF_CLOSE_SWITCH_ENTITY_ID):
+        data[CONF_CONTROL_METHOD] = CONTROL_METHOD_SWITCHES
+    else:
+        # Default to switches if unclear
+        data[CONF_CONTROL_METHOD] = CONTROL_METHOD_SWITCHES
+    return data, unique_id
+
+
+def _migrate_3_to_4(
+    data: dict[str, Any], unique_id: str | None
+) -> _MigrationResult | None:
+    """Add device class support."""
+    # Add device_class field with empty default (auto-detect)
+    if CONF_DEVICE_CLASS not in data:
+        data[CONF_DEVICE_CLASS] = ""
+    return data, unique_id
+
+
+_MIGRATORS = {
+    1: _migrate_1_to_2,
+    2: _migrate_2_to_3,
+    3: _migrate_3_to_4,
+}
+
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Migrate old entry to new version."""
+    if config_entry.version >= CURRENT_CONFIG_VERSION:
+        # No migration needed
+        return True
+
     _LOGGER.debug("Migrating config entry from version %s", config_entry.version)
 
     new_data = dict(config_entry.data)
+    new_unique_id = config_entry.unique_id
     new_version = config_entry.version
-    
-    # Migration from version 1 to 2: Add name-based unique_id
-    if config_entry.version == 1:
-        name = new_data.get(CONF_NAME, "")
-        if name:
-            new_unique_id = re.sub(r'[^a-z0-9_]', '_', name.lower())
-            new_version = 2
-        else:
-            _LOGGER.error("Migration failed: no name found in config")
+
+    # Walk the migration chain one version at a time
+    while new_version < CURRENT_CONFIG_VERSION:
+        migrator = _MIGRATORS.get(new_version)
+        if migrator is None:
+            _LOGGER.error(
+                "Migration failed: unsupported config entry version %s", new_version
+            )
             return False
-    
-    # Migration from version 2 to 3: Add control method
-    if config_entry.version <= 2:
-        # Determine control method based on existing configuration
-        if new_data.get(CONF_COVER_ENTITY_ID):
-            new_data[CONF_CONTROL_METHOD] = CONTROL_METHOD_EXISTING_COVER
-        elif new_data.get(CONF_OPEN_SWITCH_ENTITY_ID) and new_data.get(CONF_CLOSE_SWITCH_ENTITY_ID):
-            new_data[CONF_CONTROL_METHOD] = CONTROL_METHOD_SWITCHES
-        else:
-            # Default to switches if unclear
-            new_data[CONF_CONTROL_METHOD] = CONTROL_METHOD_SWITCHES
-        
-        new_version = 3
-        
-        # Generate stable unique_id if not already done
-        if config_entry.version == 1:
-            name = new_data.get(CONF_NAME, "")
-            if name:
-                new_unique_id = re.sub(r'[^a-z0-9_]', '_', name.lower())
-            else:
-                _LOGGER.error("Migration failed: no name found in config")
-                return False
-        else:
-            new_unique_id = config_entry.unique_id
-    
-    # Migration from version 3 to 4: Add device class support
-    if config_entry.version <= 3:
-        # Add device_class field with empty default (auto-detect)
-        if CONF_DEVICE_CLASS not in new_data:
-            new_data[CONF_DEVICE_CLASS] = ""
-        new_version = 4
-    
-    # Apply migration if needed
-    if new_version > config_entry.version:
-        hass.config_entries.async_update_entry(
-            config_entry,
-            data=new_data,
-            unique_id=new_unique_id if 'new_unique_id' in locals() else config_entry.unique_id,
-            version=new_version
-        )
-        
-        _LOGGER.info("Migration to version %s successful", new_version)
-        return True
-    
-    # No migration needed
+        result = migrator(new_data, new_unique_id)
+        if result is None:
+            return False
+        new_data, new_unique_id = result
+        new_version += 1
+
+    updates: dict[str, Any] = {"data": new_data, "version": new_version}
+    # Only rewrite the unique_id index when the id actually changes
+    if new_unique_id != config_entry.unique_id:
+        updates["unique_id"] = new_unique_id
+
+    hass.config_entries.async_update_entry(config_entry, **updates)
+
+    _LOGGER.info("Migration to version %s successful", new_version)
     return True
 
 
@@ -102,9 +119,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             CURRENT_CONFIG_VERSION
         )
     
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
-
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -115,10 +129,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id, None)
-
-    return unload_ok
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
@@ -1,9 +1,11 @@
 """Config flow for ChronoShade integration."""
 from __future__ import annotations
 
+import functools
 import json
 import logging
-import re
+import math
+from collections.abc import Mapping
 from typing import Any
 
 import voluptuous as vol
@@ -14,6 +16,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import selector
 import homeassistant.helpers.config_validation as cv
+from homeassistant.util.json import json_loads
 
 from .const import (
     DOMAIN,
@@ -32,14 +35,99 @@ from .const import (
     CONF_DEVICE_CLASS,
     CONTROL_METHOD_SWITCHES,
     CONTROL_METHOD_EXISTING_COVER,
+    CONFIG_MODE_STANDARD,
+    CONFIG_MODE_ADVANCED,
+    CONFIG_MODE_AUTOMATIC,
     DEFAULT_OPENING_TIME_MAP,
     DEFAULT_CLOSING_TIME_MAP,
     CURRENT_CONFIG_VERSION,
 )
+from .util import slugify_name
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class _ConfigInvalid(ValueError):
+    """Invalid form input, reported back to the user as a form error."""
+
+
+# Longest time map text accepted before parsing; real maps are a few dozen bytes
+_MAX_TIME_MAP_LENGTH = 65536
+
+# Fixed validation messages, so their raise sites do no formatting
+_ERR_TIME_MAP_EMPTY = "Time map cannot be empty"
+_ERR_TIME_MAP_NOT_OBJECT = "Time map must be a JSON object (dictionary)"
+_ERR_TIME_MAP_TOO_LARGE = "Time map is too large"
+_ERR_TILT_NOT_FINITE = "Tilt time must be a finite number"
+_ERR_TILT_NOT_POSITIVE = "Tilt time must be positive"
+_ERR_TILT_TOO_LONG = "Tilt time cannot exceed 300 seconds"
+
+# Time map directions, resolved once from the map_type label
+_OPENING_MAP = 0
+_CLOSING_MAP = 1
+_MAP_DIRECTIONS = {"Opening": _OPENING_MAP, "Closing": _CLOSING_MAP}
+
+
+# Selector configs run domain through cv.ensure_list, which only passes
+# lists through unchanged, so these stay lists rather than tuples
+_SWITCH_DOMAINS = ["switch", "script", "automation", "input_boolean", "button"]
+_COVER_DOMAINS = ["cover"]
+
+# Entity selectors are stateless, so every form shares the same instances
+_SWITCH_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain=_SWITCH_DOMAINS)
+)
+_COVER_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain=_COVER_DOMAINS)
+)
+
+_USER_SCHEMA = vol.Schema({
+    vol.Required(CONF_CONTROL_METHOD): vol.In({
+        CONTROL_METHOD_SWITCHES: "Individual switch entities (open/close/stop)",
+        CONTROL_METHOD_EXISTING_COVER: "Existing cover entity"
+    })
+})
+
+_SWITCHES_MODE_SCHEMA = vol.Schema({
+    vol.Required("config_mode"): vol.In({
+        CONFIG_MODE_STANDARD: "Standard - Simple time and position setup",
+        CONFIG_MODE_ADVANCED: "Advanced - Full JSON time maps",
+        CONFIG_MODE_AUTOMATIC: "Automatic - Quick setup with detection"
+    })
+})
+
+_EXISTING_COVER_MODE_SCHEMA = vol.Schema({
+    vol.Required("config_mode"): vol.In({
+        CONFIG_MODE_STANDARD: "Standard - Simple time and position setup",
+        CONFIG_MODE_ADVANCED: "Advanced - Full JSON time maps",
+        CONFIG_MODE_AUTOMATIC: "Automatic - Quick setup with defaults"
+    })
+})
+
+_DEVICE_CLASS_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            {"value": "", "label": "Auto-detect (Blind if tilt, Shade if not)"},
+            {"value": "awning", "label": "Awning"},
+            {"value": "blind", "label": "Blind"},
+            {"value": "curtain", "label": "Curtain"},
+            {"value": "damper", "label": "Damper"},
+            {"value": "door", "label": "Door"},
+            {"value": "garage", "label": "Garage"},
+            {"value": "gate", "label": "Gate"},
+            {"value": "shade", "label": "Shade"},
+            {"value": "shutter", "label": "Shutter"},
+            {"value": "window", "label": "Window"},
+        ]
+    )
+)
+
+# Name fragments that mark a switch entity as a momentary button
+_BUTTON_NAME_PATTERNS = ("button", "press", "push", "momentary")
+
+_TRAVEL_TIME_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=0.1, max=300))
+
+
 class TimeMapValidator:
     """Validator for time maps with comprehensive error messages."""
     
@@ -47,42 +135,56 @@ class TimeMapValidator:
     def validate_json_format(time_map_str: str) -> dict[str, Any]:
         """Validate JSON format and return parsed data."""
         if not time_map_str or not time_map_str.strip():
-            raise vol.Invalid("Time map cannot be empty")
+            raise _ConfigInvalid(_ERR_TIME_MAP_EMPTY)
         
         try:
-            data = json.loads(time_map_str)
+            data = json_loads(time_map_str)
         except json.JSONDecodeError as err:
-            raise vol.Invalid(f"Invalid JSON format: {err}") from err
+            raise _ConfigInvalid(f"Invalid JSON format: {err}") from err
         
         if not isinstance(data, dict):
-            raise vol.Invalid("Time map must be a JSON object (dictionary)")
+            raise _ConfigInvalid(_ERR_TIME_MAP_NOT_OBJECT)
         
         if not data:
-            raise vol.Invalid("Time map cannot be empty")
+            raise _ConfigInvalid(_ERR_TIME_MAP_EMPTY)
         
         return data
     
     @staticmethod
     def validate_time_position_pairs(data: dict[str, Any]) -> dict[float, int]:
         """Validate and convert time-position pairs."""
+        # Straight-line check for the usual shape: numeric keys and JSON
+        # integer positions in range. Anything else takes the per-pair path
+        # below so the error names the offending entry.
+        try:
+            time_map = dict(zip(map(float, data), data.values()))
+        except (ValueError, TypeError):
+            pass
+        else:
+            if min(time_map, default=0) >= 0 and all(
+                type(position) is int and 0 <= position <= 100
+                for position in time_map.values()
+            ):
+                return time_map
+        
         time_map = {}
         
         for time_str, position in data.items():
             # Validate time
             try:
                 time_val = float(time_str)
-                if time_val < 0:
-                    raise vol.Invalid(f"Time '{time_str}' must be non-negative")
             except (ValueError, TypeError) as err:
-                raise vol.Invalid(f"Invalid time value '{time_str}': must be a number") from err
+                raise _ConfigInvalid(f"Invalid time value '{time_str}': must be a number") from err
+            if time_val < 0:
+                raise _ConfigInvalid(f"Time '{time_str}' must be non-negative")
             
             # Validate position
             try:
                 pos_val = int(position)
-                if not 0 <= pos_val <= 100:
-                    raise vol.Invalid(f"Position {pos_val} at time {time_val} must be between 0 and 100")
             except (ValueError, TypeError) as err:
-                raise vol.Invalid(f"Invalid position value '{position}' at time {time_val}: must be an integer") from err
+                raise _ConfigInvalid(f"Invalid position value '{position}' at time {time_val}: must be an integer") from err
+            if not 0 <= pos_val <= 100:
+                raise _ConfigInvalid(f"Position {pos_val} at time {time_val} must be between 0 and 100")
             
             time_map[time_val] = pos_val
         
@@ -92,60 +194,89 @@ class TimeMapValidator:
     def validate_time_sequence(time_map: dict[float, int], map_type: str) -> None:
         """Validate time sequence and position progression."""
         if not time_map:
-            raise vol.Invalid(f"{map_type} time map cannot be empty")
+            raise _ConfigInvalid(f"{map_type} time map cannot be empty")
         
-        # Sort by time
-        sorted_times = sorted(time_map.keys())
-        positions = [time_map[t] for t in sorted_times]
+        # Sort by time once; the start/end checks only need the two ends
+        items = sorted(time_map.items())
+        first_time, first_pos = items[0]
+        last_pos = items[-1][1]
         
         # Must start at time 0
-        if sorted_times[0] != 0:
-            raise vol.Invalid(f"{map_type} time map must start at time 0 (found {sorted_times[0]})")
+        if first_time != 0:
+            raise _ConfigInvalid(f"{map_type} time map must start at time 0 (found {first_time})")
         
         # Validate start/end positions based on map type
-        if map_type.lower() == "opening":
-            if positions[0] != 0:
-                raise vol.Invalid(f"Opening time map must start at position 0 (closed), found {positions[0]}")
-            if positions[-1] != 100:
-                raise vol.Invalid(f"Opening time map must end at position 100 (open), found {positions[-1]}")
-            
-            # Validate monotonic increasing
-            for i in range(1, len(positions)):
-                if positions[i] < positions[i-1]:
-                    raise vol.Invalid(
-                        f"Opening time map positions must be non-decreasing. "
-                        f"Position {positions[i]} at time {sorted_times[i]} is less than "
-                        f"position {positions[i-1]} at time {sorted_times[i-1]}"
-                    )
+        direction = _MAP_DIRECTIONS.get(map_type)
+        if direction is None:
+            # Callers pass "Opening"/"Closing"; other spellings are normalized
+            direction = _MAP_DIRECTIONS.get(map_type.capitalize())
+        is_opening = direction == _OPENING_MAP
+        if is_opening:
+            if first_pos != 0:
+                raise _ConfigInvalid(f"Opening time map must start at position 0 (closed), found {first_pos}")
+            if last_pos != 100:
+                raise _ConfigInvalid(f"Opening time map must end at position 100 (open), found {last_pos}")
+        elif direction == _CLOSING_MAP:
+            if first_pos != 100:
+                raise _ConfigInvalid(f"Closing time map must start at position 100 (open), found {first_pos}")
+            if last_pos != 0:
+                raise _ConfigInvalid(f"Closing time map must end at position 0 (closed), found {last_pos}")
+        else:
+            return
         
-        elif map_type.lower() == "closing":
-            if positions[0] != 100:
-                raise vol.Invalid(f"Closing time map must start at position 100 (open), found {positions[0]}")
-            if positions[-1] != 0:
-                raise vol.Invalid(f"Closing time map must end at position 0 (closed), found {positions[-1]}")
-            
-            # Validate monotonic decreasing
-            for i in range(1, len(positions)):
-                if positions[i] > positions[i-1]:
-                    raise vol.Invalid(
-                        f"Closing time map positions must be non-increasing. "
-                        f"Position {positions[i]} at time {sorted_times[i]} is greater than "
-                        f"position {positions[i-1]} at time {sorted_times[i-1]}"
+        # Validate monotonic progression in one pass over the sorted points
+        prev_time, prev_pos = first_time, first_pos
+        for time_val, pos_val in items:
+            if is_opening:
+                if pos_val < prev_pos:
+                    raise _ConfigInvalid(
+                        f"Opening time map positions must be non-decreasing. "
+                        f"Position {pos_val} at time {time_val} is less than "
+                        f"position {prev_pos} at time {prev_time}"
                     )
+            elif pos_val > prev_pos:
+                raise _ConfigInvalid(
+                    f"Closing time map positions must be non-increasing. "
+                    f"Position {pos_val} at time {time_val} is greater than "
+                    f"position {prev_pos} at time {prev_time}"
+                )
+            prev_time, prev_pos = time_val, pos_val
     
     @classmethod
     def validate_time_map(cls, time_map_str: str, map_type: str) -> dict[float, int]:
         """Complete validation of time map."""
+        # Reject oversized input before it can become a cache key
+        if time_map_str and len(time_map_str) > _MAX_TIME_MAP_LENGTH:
+            raise _ConfigInvalid(_ERR_TIME_MAP_TOO_LARGE)
+        result = _validate_time_map_cached(time_map_str, map_type)
+        if isinstance(result, str):
+            raise _ConfigInvalid(result)
+        return dict(result)
+
+
+@functools.lru_cache(maxsize=128)
+def _validate_time_map_cached(
+    time_map_str: str, map_type: str
+) -> tuple[tuple[float, int], ...] | str:
+    """Validate a time map, memoized on the raw form input.
+
+    Results are returned as immutable pairs so cached entries can be shared.
+    A rejected map returns its error message instead, since lru_cache does
+    not remember raised exceptions and the same bad input is often resubmitted.
+    """
+    try:
         # Step 1: Validate JSON format
-        data = cls.validate_json_format(time_map_str)
+        data = TimeMapValidator.validate_json_format(time_map_str)
         
         # Step 2: Validate time-position pairs
-        time_map = cls.validate_time_position_pairs(data)
+        time_map = TimeMapValidator.validate_time_position_pairs(data)
         
         # Step 3: Validate sequence and progression
-        cls.validate_time_sequence(time_map, map_type)
-        
-        return time_map
+        TimeMapValidator.validate_time_sequence(time_map, map_type)
+    except _ConfigInvalid as err:
+        return str(err)
+    
+    return tuple(time_map.items())
 
 
 def validate_tilt_time(value: Any) -> float | None:
@@ -153,20 +284,29 @@ def validate_tilt_time(value: Any) -> float | None:
     if value is None or value == "" or value == 0:
         return None
     
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+    
     try:
         float_val = float(value)
-        if float_val <= 0:
-            raise vol.Invalid("Tilt time must be positive")
-        if float_val > 300:
-            raise vol.Invalid("Tilt time cannot exceed 300 seconds")
-        return float_val
     except (ValueError, TypeError) as err:
-        raise vol.Invalid(f"Invalid tilt time: {err}") from err
+        raise _ConfigInvalid(f"Invalid tilt time: {err}") from err
+    
+    if not math.isfinite(float_val):
+        raise _ConfigInvalid(_ERR_TILT_NOT_FINITE)
+    if not 0 < float_val <= 300:
+        if float_val > 300:
+            raise _ConfigInvalid(_ERR_TILT_TOO_LONG)
+        raise _ConfigInvalid(_ERR_TILT_NOT_POSITIVE)
+    return float_val
 
 
+@functools.lru_cache(maxsize=256)
 def generate_unique_id(name: str) -> str:
     """Generate a stable unique ID from name."""
-    return re.sub(r'[^a-z0-9_]', '_', name.lower().strip())
+    return slugify_name(name.strip())
 
 
 def format_time_map_for_ui(time_map: dict[float, int] | dict[str, int] | dict) -> str:
@@ -174,9 +314,16 @@ def format_time_map_for_ui(time_map: dict[float, int] | dict[str, int] | dict) -
     if not time_map:
         return "{}"
     
+    # Stored maps rarely change between renders, so reuse the serialized form
+    return _format_time_map_items(tuple(time_map.items()))
+
+
+@functools.lru_cache(maxsize=32)
+def _format_time_map_items(items: tuple[tuple[float | str, int], ...]) -> str:
+    """Serialize time map items to sorted JSON."""
     # Handle both float and string keys
     string_map = {}
-    for key, value in time_map.items():
+    for key, value in items:
         # Convert key to string if it's not already
         str_key = str(key) if not isinstance(key, str) else key
         string_map[str_key] = value
@@ -184,11 +331,125 @@ def format_time_map_for_ui(time_map: dict[float, int] | dict[str, int] | dict) -
     return json.dumps(string_map, sort_keys=True)
 
 
+_DEFAULT_OPENING_MAP_JSON = format_time_map_for_ui(DEFAULT_OPENING_TIME_MAP)
+_DEFAULT_CLOSING_MAP_JSON = format_time_map_for_ui(DEFAULT_CLOSING_TIME_MAP)
+
+
 def create_linear_time_map(total_time: float, start_position: int, end_position: int) -> dict[float, int]:
     """Create a linear time map from start to end position over total time."""
     return {0.0: start_position, total_time: end_position}
 
 
+_SWITCH_ENTITY_FIELDS = {
+    vol.Required(CONF_OPEN_SWITCH_ENTITY_ID): _SWITCH_SELECTOR,
+    vol.Required(CONF_CLOSE_SWITCH_ENTITY_ID): _SWITCH_SELECTOR,
+    vol.Optional(CONF_STOP_SWITCH_ENTITY_ID): _SWITCH_SELECTOR,
+}
+
+# Tilt fields are free text so they can be left empty for covers without tilt
+_TILT_TIME_FIELDS = {
+    vol.Optional(CONF_TILTING_TIME_DOWN): str,
+    vol.Optional(CONF_TILTING_TIME_UP): str,
+}
+
+
+def _build_setup_schema(control_method: str, config_mode: str) -> vol.Schema:
+    """Build the setup form schema for a control method and config mode."""
+    if control_method == CONTROL_METHOD_SWITCHES:
+        schema: dict[Any, Any] = {vol.Required(CONF_NAME): str, **_SWITCH_ENTITY_FIELDS}
+        if config_mode != CONFIG_MODE_AUTOMATIC:
+            schema[vol.Optional(CONF_IS_BUTTON, default=False)] = bool
+    else:
+        schema = {
+            vol.Required(CONF_NAME): str,
+            vol.Required(CONF_COVER_ENTITY_ID): _COVER_SELECTOR,
+        }
+    
+    if config_mode == CONFIG_MODE_AUTOMATIC:
+        return vol.Schema(schema)
+    
+    if config_mode == CONFIG_MODE_STANDARD:
+        schema[vol.Required(CONF_OPENING_TIME, default=10.0)] = _TRAVEL_TIME_VALIDATOR
+        schema[vol.Required(CONF_CLOSING_TIME, default=10.0)] = _TRAVEL_TIME_VALIDATOR
+    else:
+        schema[vol.Required(CONF_OPENING_TIME_MAP, default=_DEFAULT_OPENING_MAP_JSON)] = str
+        schema[vol.Required(CONF_CLOSING_TIME_MAP, default=_DEFAULT_CLOSING_MAP_JSON)] = str
+    
+    schema.update(_TILT_TIME_FIELDS)
+    schema[vol.Optional(CONF_DEVICE_CLASS)] = _DEVICE_CLASS_SELECTOR
+    return vol.Schema(schema)
+
+
+# Setup forms have no per-entry defaults, so every shape is built at import
+_SETUP_SCHEMAS = {
+    (control_method, config_mode): _build_setup_schema(control_method, config_mode)
+    for control_method in (CONTROL_METHOD_SWITCHES, CONTROL_METHOD_EXISTING_COVER)
+    for config_mode in (CONFIG_MODE_STANDARD, CONFIG_MODE_ADVANCED, CONFIG_MODE_AUTOMATIC)
+}
+
+
+# Reconfigure forms are prefilled with suggested values from the entry,
+# so the schemas themselves carry no defaults and are built once
+_RECONFIGURE_TIME_MAP_FIELDS = {
+    vol.Required(CONF_OPENING_TIME_MAP): str,
+    vol.Required(CONF_CLOSING_TIME_MAP): str,
+    **_TILT_TIME_FIELDS,
+}
+
+_RECONFIGURE_SCHEMAS = {
+    CONTROL_METHOD_SWITCHES: vol.Schema({
+        vol.Required(CONF_NAME): str,
+        **_SWITCH_ENTITY_FIELDS,
+        vol.Optional(CONF_IS_BUTTON): bool,
+        **_RECONFIGURE_TIME_MAP_FIELDS,
+    }),
+    CONTROL_METHOD_EXISTING_COVER: vol.Schema({
+        vol.Required(CONF_NAME): str,
+        vol.Required(CONF_COVER_ENTITY_ID): _COVER_SELECTOR,
+        **_RECONFIGURE_TIME_MAP_FIELDS,
+    }),
+}
+
+
+_OPTIONS_SCHEMA = vol.Schema(_TILT_TIME_FIELDS)
+
+
+def _tilt_default(data: Mapping[str, Any], key: str) -> str:
+    """Return a stored tilt time as form text, blank when unset."""
+    value = data.get(key)
+    return str(value) if value else ""
+
+
+def _reconfigure_suggested_values(data: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the entry data in the form the reconfigure fields display."""
+    return {
+        **data,
+        CONF_IS_BUTTON: data.get(CONF_IS_BUTTON, False),
+        CONF_OPENING_TIME_MAP: (
+            format_time_map_for_ui(data[CONF_OPENING_TIME_MAP])
+            if CONF_OPENING_TIME_MAP in data else _DEFAULT_OPENING_MAP_JSON
+        ),
+        CONF_CLOSING_TIME_MAP: (
+            format_time_map_for_ui(data[CONF_CLOSING_TIME_MAP])
+            if CONF_CLOSING_TIME_MAP in data else _DEFAULT_CLOSING_MAP_JSON
+        ),
+        CONF_TILTING_TIME_DOWN: _tilt_default(data, CONF_TILTING_TIME_DOWN),
+        CONF_TILTING_TIME_UP: _tilt_default(data, CONF_TILTING_TIME_UP),
+    }
+
+
+@callback
+def _async_update_entry_data(
+    hass: HomeAssistant,
+    config_entry: config_entries.ConfigEntry,
+    changes: dict[str, Any],
+) -> None:
+    """Merge changed fields into the entry data and save the entry."""
+    hass.config_entries.async_update_entry(
+        config_entry, data=config_entry.data | changes
+    )
+
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Cover Time Based."""
 
@@ -198,6 +459,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize config flow."""
         self._control_method: str | None = None
         self._name: str | None = None
+        self._reconfigure_config_entry: config_entries.ConfigEntry | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -213,12 +475,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Required(CONF_CONTROL_METHOD): vol.In({
-                    CONTROL_METHOD_SWITCHES: "Individual switch entities (open/close/stop)",
-                    CONTROL_METHOD_EXISTING_COVER: "Existing cover entity"
-                })
-            }),
+            data_schema=_USER_SCHEMA,
         )
 
     async def async_step_switches(
@@ -228,22 +485,16 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             config_mode = user_input["config_mode"]
             
-            if config_mode == "standard":
+            if config_mode == CONFIG_MODE_STANDARD:
                 return await self.async_step_switches_standard()
-            elif config_mode == "advanced":
+            elif config_mode == CONFIG_MODE_ADVANCED:
                 return await self.async_step_switches_advanced()
             else:  # automatic
                 return await self.async_step_switches_automatic()
 
         return self.async_show_form(
             step_id="switches",
-            data_schema=vol.Schema({
-                vol.Required("config_mode"): vol.In({
-                    "standard": "Standard - Simple time and position setup",
-                    "advanced": "Advanced - Full JSON time maps",
-                    "automatic": "Automatic - Quick setup with detection"
-                })
-            }),
+            data_schema=_SWITCHES_MODE_SCHEMA,
         )
 
     async def async_step_switches_standard(
@@ -254,54 +505,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                # Validate required entities
-                open_entity = user_input[CONF_OPEN_SWITCH_ENTITY_ID]
-                close_entity = user_input[CONF_CLOSE_SWITCH_ENTITY_ID]
-                stop_entity = user_input.get(CONF_STOP_SWITCH_ENTITY_ID)
-                
-                # Check entities exist
-                if self.hass.states.get(open_entity) is None:
-                    raise vol.Invalid(f"Open entity '{open_entity}' not found")
-                if self.hass.states.get(close_entity) is None:
-                    raise vol.Invalid(f"Close entity '{close_entity}' not found")
-                if stop_entity and self.hass.states.get(stop_entity) is None:
-                    raise vol.Invalid(f"Stop entity '{stop_entity}' not found")
-                
-                # Create simple time maps from user input
-                opening_time = float(user_input[CONF_OPENING_TIME])
-                closing_time = float(user_input[CONF_CLOSING_TIME])
-                
-                opening_map = create_linear_time_map(opening_time, 0, 100)
-                closing_map = create_linear_time_map(closing_time, 100, 0)
-                
-                # Validate tilt times
-                tilt_down = validate_tilt_time(user_input.get(CONF_TILTING_TIME_DOWN))
-                tilt_up = validate_tilt_time(user_input.get(CONF_TILTING_TIME_UP))
-                
-                # Check for existing entry with same name
-                name = user_input[CONF_NAME]
-                unique_id = generate_unique_id(name)
-                await self.async_set_unique_id(unique_id)
-                self._abort_if_unique_id_configured()
-                
-                # Create entry
-                data = {
-                    CONF_NAME: name,
-                    CONF_CONTROL_METHOD: CONTROL_METHOD_SWITCHES,
-                    CONF_OPEN_SWITCH_ENTITY_ID: open_entity,
-                    CONF_CLOSE_SWITCH_ENTITY_ID: close_entity,
-                    CONF_STOP_SWITCH_ENTITY_ID: stop_entity,
-                    CONF_IS_BUTTON: user_input.get(CONF_IS_BUTTON, False),
-                    CONF_OPENING_TIME_MAP: opening_map,
-                    CONF_CLOSING_TIME_MAP: closing_map,
-                    CONF_TILTING_TIME_DOWN: tilt_down,
-                    CONF_TILTING_TIME_UP: tilt_up,
-                    CONF_DEVICE_CLASS: user_input.get(CONF_DEVICE_CLASS, ""),
-                }
-                
-                return self.async_create_entry(title=name, data=data)
+                return await self._async_create_cover_entry(
+                    user_input, CONTROL_METHOD_SWITCHES, CONFIG_MODE_STANDARD
+                )
                 
-            except vol.Invalid as err:
+            except (_ConfigInvalid, vol.Invalid) as err:
                 errors["base"] = str(err)
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected error in standard switches config")
@@ -309,50 +517,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="switches_standard",
-            data_schema=vol.Schema({
-                vol.Required(CONF_NAME): str,
-                vol.Required(CONF_OPEN_SWITCH_ENTITY_ID): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["switch", "script", "automation", "input_boolean", "button"]
-                    )
-                ),
-                vol.Required(CONF_CLOSE_SWITCH_ENTITY_ID): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["switch", "script", "automation", "input_boolean", "button"]
-                    )
-                ),
-                vol.Optional(CONF_STOP_SWITCH_ENTITY_ID): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["switch", "script", "automation", "input_boolean", "button"]
-                    )
-                ),
-                vol.Optional(CONF_IS_BUTTON, default=False): bool,
-                vol.Required(CONF_OPENING_TIME, default=10.0): vol.All(
-                    vol.Coerce(float), vol.Range(min=0.1, max=300)
-                ),
-                vol.Required(CONF_CLOSING_TIME, default=10.0): vol.All(
-                    vol.Coerce(float), vol.Range(min=0.1, max=300)
-                ),
-                vol.Optional(CONF_TILTING_TIME_DOWN): str,
-                vol.Optional(CONF_TILTING_TIME_UP): str,
-                vol.Optional(CONF_DEVICE_CLASS): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"value": "", "label": "Auto-detect (Blind if tilt, Shade if not)"},
-                            {"value": "awning", "label": "Awning"},
-                            {"value": "blind", "label": "Blind"},
-                            {"value": "curtain", "label": "Curtain"},
-                            {"value": "damper", "label": "Damper"},
-                            {"value": "door", "label": "Door"},
-                            {"value": "garage", "label": "Garage"},
-                            {"value": "gate", "label": "Gate"},
-                            {"value": "shade", "label": "Shade"},
-                            {"value": "shutter", "label": "Shutter"},
-                            {"value": "window", "label": "Window"},
-                        ]
-                    )
-                ),
-            }),
+            data_schema=_SETUP_SCHEMAS[CONTROL_METHOD_SWITCHES, CONFIG_MODE_STANDARD],
             errors=errors,
         )
 
@@ -364,55 +529,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                # Validate required entities
-                open_entity = user_input[CONF_OPEN_SWITCH_ENTITY_ID]
-                close_entity = user_input[CONF_CLOSE_SWITCH_ENTITY_ID]
-                stop_entity = user_input.get(CONF_STOP_SWITCH_ENTITY_ID)
-                
-                # Check entities exist
-                if self.hass.states.get(open_entity) is None:
-                    raise vol.Invalid(f"Open entity '{open_entity}' not found")
-                if self.hass.states.get(close_entity) is None:
-                    raise vol.Invalid(f"Close entity '{close_entity}' not found")
-                if stop_entity and self.hass.states.get(stop_entity) is None:
-                    raise vol.Invalid(f"Stop entity '{stop_entity}' not found")
-                
-                # Validate time maps
-                opening_map = TimeMapValidator.validate_time_map(
-                    user_input[CONF_OPENING_TIME_MAP], "Opening"
-                )
-                closing_map = TimeMapValidator.validate_time_map(
-                    user_input[CONF_CLOSING_TIME_MAP], "Closing"
+                return await self._async_create_cover_entry(
+                    user_input, CONTROL_METHOD_SWITCHES, CONFIG_MODE_ADVANCED
                 )
                 
-                # Validate tilt times
-                tilt_down = validate_tilt_time(user_input.get(CONF_TILTING_TIME_DOWN))
-                tilt_up = validate_tilt_time(user_input.get(CONF_TILTING_TIME_UP))
-                
-                # Check for existing entry with same name
-                name = user_input[CONF_NAME]
-                unique_id = generate_unique_id(name)
-                await self.async_set_unique_id(unique_id)
-                self._abort_if_unique_id_configured()
-                
-                # Create entry
-                data = {
-                    CONF_NAME: name,
-                    CONF_CONTROL_METHOD: CONTROL_METHOD_SWITCHES,
-                    CONF_OPEN_SWITCH_ENTITY_ID: open_entity,
-                    CONF_CLOSE_SWITCH_ENTITY_ID: close_entity,
-                    CONF_STOP_SWITCH_ENTITY_ID: stop_entity,
-                    CONF_IS_BUTTON: user_input.get(CONF_IS_BUTTON, False),
-                    CONF_OPENING_TIME_MAP: opening_map,
-                    CONF_CLOSING_TIME_MAP: closing_map,
-                    CONF_TILTING_TIME_DOWN: tilt_down,
-                    CONF_TILTING_TIME_UP: tilt_up,
-                    CONF_DEVICE_CLASS: user_input.get(CONF_DEVICE_CLASS, ""),
-                }
-                
-                return self.async_create_entry(title=name, data=data)
-                
-            except vol.Invalid as err:
+            except (_ConfigInvalid, vol.Invalid) as err:
                 errors["base"] = str(err)
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected error in advanced switches config")
@@ -420,52 +541,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="switches_advanced",
-            data_schema=vol.Schema({
-                vol.Required(CONF_NAME): str,
-                vol.Required(CONF_OPEN_SWITCH_ENTITY_ID): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["switch", "script", "automation", "input_boolean", "button"]
-                    )
-                ),
-                vol.Required(CONF_CLOSE_SWITCH_ENTITY_ID): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["switch", "script", "automation", "input_boolean", "button"]
-                    )
-                ),
-                vol.Optional(CONF_STOP_SWITCH_ENTITY_ID): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["switch", "script", "automation", "input_boolean", "button"]
-                    )
-                ),
-                vol.Optional(CONF_IS_BUTTON, default=False): bool,
-                vol.Required(
-                    CONF_OPENING_TIME_MAP,
-                    default=format_time_map_for_ui(DEFAULT_OPENING_TIME_MAP)
-                ): str,
-                vol.Required(
-                    CONF_CLOSING_TIME_MAP,
-                    default=format_time_map_for_ui(DEFAULT_CLOSING_TIME_MAP)
-                ): str,
-                vol.Optional(CONF_TILTING_TIME_DOWN): str,
-                vol.Optional(CONF_TILTING_TIME_UP): str,
-                vol.Optional(CONF_DEVICE_CLASS): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"value": "", "label": "Auto-detect (Blind if tilt, Shade if not)"},
-                            {"value": "awning", "label": "Awning"},
-                            {"value": "blind", "label": "Blind"},
-                            {"value": "curtain", "label": "Curtain"},
-                            {"value": "damper", "label": "Damper"},
-                            {"value": "door", "label": "Door"},
-                            {"value": "garage", "label": "Garage"},
-                            {"value": "gate", "label": "Gate"},
-                            {"value": "shade", "label": "Shade"},
-                            {"value": "shutter", "label": "Shutter"},
-                            {"value": "window", "label": "Window"},
-                        ]
-                    )
-                ),
-            }),
+            data_schema=_SETUP_SCHEMAS[CONTROL_METHOD_SWITCHES, CONFIG_MODE_ADVANCED],
             errors=errors,
         )
 
@@ -477,51 +553,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                # Validate required entities
-                open_entity = user_input[CONF_OPEN_SWITCH_ENTITY_ID]
-                close_entity = user_input[CONF_CLOSE_SWITCH_ENTITY_ID]
-                stop_entity = user_input.get(CONF_STOP_SWITCH_ENTITY_ID)
-                
-                # Check entities exist
-                if self.hass.states.get(open_entity) is None:
-                    raise vol.Invalid(f"Open entity '{open_entity}' not found")
-                if self.hass.states.get(close_entity) is None:
-                    raise vol.Invalid(f"Close entity '{close_entity}' not found")
-                if stop_entity and self.hass.states.get(stop_entity) is None:
-                    raise vol.Invalid(f"Stop entity '{stop_entity}' not found")
-                
-                # Auto-detect entity types and set defaults
-                open_state = self.hass.states.get(open_entity)
-                is_button = self._detect_button_entity(open_state)
-                
-                # Use default time maps for automatic setup
-                opening_map = DEFAULT_OPENING_TIME_MAP.copy()
-                closing_map = DEFAULT_CLOSING_TIME_MAP.copy()
-                
-                # Check for existing entry with same name
-                name = user_input[CONF_NAME]
-                unique_id = generate_unique_id(name)
-                await self.async_set_unique_id(unique_id)
-                self._abort_if_unique_id_configured()
-                
-                # Create entry
-                data = {
-                    CONF_NAME: name,
-                    CONF_CONTROL_METHOD: CONTROL_METHOD_SWITCHES,
-                    CONF_OPEN_SWITCH_ENTITY_ID: open_entity,
-                    CONF_CLOSE_SWITCH_ENTITY_ID: close_entity,
-                    CONF_STOP_SWITCH_ENTITY_ID: stop_entity,
-                    CONF_IS_BUTTON: is_button,
-                    CONF_OPENING_TIME_MAP: opening_map,
-                    CONF_CLOSING_TIME_MAP: closing_map,
-                    CONF_TILTING_TIME_DOWN: None,
-                    CONF_TILTING_TIME_UP: None,
-                    CONF_DEVICE_CLASS: user_input.get(CONF_DEVICE_CLASS, ""),
-                }
-                
-                return self.async_create_entry(title=name, data=data)
+                return await self._async_create_cover_entry(
+                    user_input, CONTROL_METHOD_SWITCHES, CONFIG_MODE_AUTOMATIC
+                )
                 
-            except vol.Invalid as err:
+            except (_ConfigInvalid, vol.Invalid) as err:
                 errors["base"] = str(err)
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected error in automatic switches config")
@@ -529,27 +565,124 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="switches_automatic",
-            data_schema=vol.Schema({
-                vol.Required(CONF_NAME): str,
-                vol.Required(CONF_OPEN_SWITCH_ENTITY_ID): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["switch", "script", "automation", "input_boolean", "button"]
-                    )
-                ),
-                vol.Required(CONF_CLOSE_SWITCH_ENTITY_ID): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["switch", "script", "automation", "input_boolean", "button"]
-                    )
-                ),
-                vol.Optional(CONF_STOP_SWITCH_ENTITY_ID): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["switch", "script", "automation", "input_boolean", "button"]
-                    )
-                ),
-            }),
+            data_schema=_SETUP_SCHEMAS[CONTROL_METHOD_SWITCHES, CONFIG_MODE_AUTOMATIC],
             errors=errors,
         )
 
+    def _validate_common(
+        self, user_input: dict[str, Any], control_method: str, config_mode: str
+    ) -> dict[str, Any]:
+        """Validate the entity, time map and tilt fields of a submitted form.
+
+        Returns the entry data for those fields, raising _ConfigInvalid on bad input.
+        """
+        info: dict[str, Any] = {}
+        
+        # Validate control entities
+        if control_method == CONTROL_METHOD_SWITCHES:
+            open_entity = user_input[CONF_OPEN_SWITCH_ENTITY_ID]
+            close_entity = user_input[CONF_CLOSE_SWITCH_ENTITY_ID]
+            stop_entity = user_input.get(CONF_STOP_SWITCH_ENTITY_ID)
+            
+            self._validate_entities_exist(
+                ("Open", open_entity),
+                ("Close", close_entity),
+                ("Stop", stop_entity),
+            )
+            
+            if config_mode == CONFIG_MODE_AUTOMATIC:
+                # Auto-detect entity types
+                is_button = self._detect_button_entity(self.hass.states.get(open_entity))
+            else:
+                is_button = user_input.get(CONF_IS_BUTTON, False)
+            
+            info[CONF_OPEN_SWITCH_ENTITY_ID] = open_entity
+            info[CONF_CLOSE_SWITCH_ENTITY_ID] = close_entity
+            info[CONF_STOP_SWITCH_ENTITY_ID] = stop_entity
+            info[CONF_IS_BUTTON] = is_button
+        else:
+            cover_entity = user_input[CONF_COVER_ENTITY_ID]
+            self._validate_entities_exist(("Cover", cover_entity))
+            info[CONF_COVER_ENTITY_ID] = cover_entity
+        
+        if config_mode == CONFIG_MODE_AUTOMATIC:
+            # Use default time maps and no tilt for automatic setup
+            info[CONF_OPENING_TIME_MAP] = DEFAULT_OPENING_TIME_MAP.copy()
+            info[CONF_CLOSING_TIME_MAP] = DEFAULT_CLOSING_TIME_MAP.copy()
+            info[CONF_TILTING_TIME_DOWN] = None
+            info[CONF_TILTING_TIME_UP] = None
+            return info
+        
+        if config_mode == CONFIG_MODE_STANDARD:
+            # Create simple time maps from user input
+            opening_time = float(user_input[CONF_OPENING_TIME])
+            closing_time = float(user_input[CONF_CLOSING_TIME])
+            
+            info[CONF_OPENING_TIME_MAP] = create_linear_time_map(opening_time, 0, 100)
+            info[CONF_CLOSING_TIME_MAP] = create_linear_time_map(closing_time, 100, 0)
+        else:
+            # Validate time maps
+            info[CONF_OPENING_TIME_MAP] = TimeMapValidator.validate_time_map(
+                user_input[CONF_OPENING_TIME_MAP], "Opening"
+            )
+            info[CONF_CLOSING_TIME_MAP] = TimeMapValidator.validate_time_map(
+                user_input[CONF_CLOSING_TIME_MAP], "Closing"
+            )
+        
+        # Validate tilt times
+        info[CONF_TILTING_TIME_DOWN] = validate_tilt_time(user_input.get(CONF_TILTING_TIME_DOWN))
+        info[CONF_TILTING_TIME_UP] = validate_tilt_time(user_input.get(CONF_TILTING_TIME_UP))
+        
+        return info
+
+    async def _async_create_cover_entry(
+        self, user_input: dict[str, Any], control_method: str, config_mode: str
+    ) -> FlowResult:
+        """Validate a setup form and create the config entry."""
+        info = self._validate_common(user_input, control_method, config_mode)
+        
+        # Check for existing entry with same name
+        name = user_input[CONF_NAME]
+        unique_id = generate_unique_id(name)
+        await self.async_set_unique_id(unique_id)
+        self._abort_if_unique_id_configured()
+        
+        # Create entry
+        data = {
+            CONF_NAME: name,
+            CONF_CONTROL_METHOD: control_method,
+            **info,
+            CONF_DEVICE_CLASS: user_input.get(CONF_DEVICE_CLASS, ""),
+        }
+        
+        return self.async_create_entry(title=name, data=data)
+
+    def _async_apply_reconfigure(
+        self,
+        config_entry: config_entries.ConfigEntry,
+        user_input: dict[str, Any],
+        control_method: str,
+    ) -> FlowResult:
+        """Validate a reconfigure form and update the existing entry."""
+        info = self._validate_common(user_input, control_method, CONFIG_MODE_ADVANCED)
+        
+        _async_update_entry_data(
+            self.hass, config_entry, {CONF_NAME: user_input[CONF_NAME], **info}
+        )
+        return self.async_abort(reason="reconfigure_successful")
+
+    def _validate_entities_exist(self, *entities: tuple[str, str | None]) -> None:
+        """Raise if any configured (label, entity_id) pair is not a known entity."""
+        # Report every missing entity at once rather than one per submit
+        states_get = self.hass.states.get
+        missing = [
+            f"{label} entity '{entity_id}'"
+            for label, entity_id in entities
+            if entity_id and states_get(entity_id) is None
+        ]
+        if missing:
+            raise _ConfigInvalid(f"{', '.join(missing)} not found")
+
     def _detect_button_entity(self, entity_state) -> bool:
         """Detect if entity is a button type."""
         if not entity_state:
@@ -563,10 +696,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return True
         
         # Check for common button patterns in entity names
-        button_patterns = ["button", "press", "push", "momentary"]
         entity_name = entity_state.attributes.get("friendly_name", entity_id).lower()
         
-        return any(pattern in entity_name for pattern in button_patterns)
+        return any(pattern in entity_name for pattern in _BUTTON_NAME_PATTERNS)
 
     async def async_step_existing_cover(
         self, user_input: dict[str, Any] | None = None
@@ -575,22 +707,16 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             config_mode = user_input["config_mode"]
             
-            if config_mode == "standard":
+            if config_mode == CONFIG_MODE_STANDARD:
                 return await self.async_step_existing_cover_standard()
-            elif config_mode == "advanced":
+            elif config_mode == CONFIG_MODE_ADVANCED:
                 return await self.async_step_existing_cover_advanced()
             else:  # automatic
                 return await self.async_step_existing_cover_automatic()
 
         return self.async_show_form(
             step_id="existing_cover",
-            data_schema=vol.Schema({
-                vol.Required("config_mode"): vol.In({
-                    "standard": "Standard - Simple time and position setup",
-                    "advanced": "Advanced - Full JSON time maps",
-                    "automatic": "Automatic - Quick setup with defaults"
-                })
-            }),
+            data_schema=_EXISTING_COVER_MODE_SCHEMA,
         )
 
     async def async_step_existing_cover_standard(
@@ -601,43 +727,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                # Validate cover entity
-                cover_entity = user_input[CONF_COVER_ENTITY_ID]
-                if self.hass.states.get(cover_entity) is None:
-                    raise vol.Invalid(f"Cover entity '{cover_entity}' not found")
-                
-                # Create simple time maps from user input
-                opening_time = float(user_input[CONF_OPENING_TIME])
-                closing_time = float(user_input[CONF_CLOSING_TIME])
-                
-                opening_map = create_linear_time_map(opening_time, 0, 100)
-                closing_map = create_linear_time_map(closing_time, 100, 0)
-                
-                # Validate tilt times
-                tilt_down = validate_tilt_time(user_input.get(CONF_TILTING_TIME_DOWN))
-                tilt_up = validate_tilt_time(user_input.get(CONF_TILTING_TIME_UP))
-                
-                # Check for existing entry with same name
-                name = user_input[CONF_NAME]
-                unique_id = generate_unique_id(name)
-                await self.async_set_unique_id(unique_id)
-                self._abort_if_unique_id_configured()
-                
-                # Create entry
-                data = {
-                    CONF_NAME: name,
-                    CONF_CONTROL_METHOD: CONTROL_METHOD_EXISTING_COVER,
-                    CONF_COVER_ENTITY_ID: cover_entity,
-                    CONF_OPENING_TIME_MAP: opening_map,
-                    CONF_CLOSING_TIME_MAP: closing_map,
-                    CONF_TILTING_TIME_DOWN: tilt_down,
-                    CONF_TILTING_TIME_UP: tilt_up,
-                    CONF_DEVICE_CLASS: user_input.get(CONF_DEVICE_CLASS, ""),
-                }
-                
-                return self.async_create_entry(title=name, data=data)
+                return await self._async_create_cover_entry(
+                    user_input, CONTROL_METHOD_EXISTING_COVER, CONFIG_MODE_STANDARD
+                )
                 
-            except vol.Invalid as err:
+            except (_ConfigInvalid, vol.Invalid) as err:
                 errors["base"] = str(err)
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected error in standard existing cover config")
@@ -645,37 +739,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="existing_cover_standard",
-            data_schema=vol.Schema({
-                vol.Required(CONF_NAME): str,
-                vol.Required(CONF_COVER_ENTITY_ID): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=["cover"])
-                ),
-                vol.Required(CONF_OPENING_TIME, default=10.0): vol.All(
-                    vol.Coerce(float), vol.Range(min=0.1, max=300)
-                ),
-                vol.Required(CONF_CLOSING_TIME, default=10.0): vol.All(
-                    vol.Coerce(float), vol.Range(min=0.1, max=300)
-                ),
-                vol.Optional(CONF_TILTING_TIME_DOWN): str,
-                vol.Optional(CONF_TILTING_TIME_UP): str,
-                vol.Optional(CONF_DEVICE_CLASS): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"value": "", "label": "Auto-detect (Blind if tilt, Shade if not)"},
-                            {"value": "awning", "label": "Awning"},
-                            {"value": "blind", "label": "Blind"},
-                            {"value": "curtain", "label": "Curtain"},
-                            {"value": "damper", "label": "Damper"},
-                            {"value": "door", "label": "Door"},
-                            {"value": "garage", "label": "Garage"},
-                            {"value": "gate", "label": "Gate"},
-                            {"value": "shade", "label": "Shade"},
-                            {"value": "shutter", "label": "Shutter"},
-                            {"value": "window", "label": "Window"},
-                        ]
-                    )
-                ),
-            }),
+            data_schema=_SETUP_SCHEMAS[CONTROL_METHOD_EXISTING_COVER, CONFIG_MODE_STANDARD],
             errors=errors,
         )
 
@@ -687,44 +751,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                # Validate cover entity
-                cover_entity = user_input[CONF_COVER_ENTITY_ID]
-                if self.hass.states.get(cover_entity) is None:
-                    raise vol.Invalid(f"Cover entity '{cover_entity}' not found")
-                
-                # Validate time maps
-                opening_map = TimeMapValidator.validate_time_map(
-                    user_input[CONF_OPENING_TIME_MAP], "Opening"
+                return await self._async_create_cover_entry(
+                    user_input, CONTROL_METHOD_EXISTING_COVER, CONFIG_MODE_ADVANCED
                 )
-                closing_map = TimeMapValidator.validate_time_map(
-                    user_input[CONF_CLOSING_TIME_MAP], "Closing"
-                )
-                
-                # Validate tilt times
-                tilt_down = validate_tilt_time(user_input.get(CONF_TILTING_TIME_DOWN))
-                tilt_up = validate_tilt_time(user_input.get(CONF_TILTING_TIME_UP))
-                
-                # Check for existing entry with same name
-                name = user_input[CONF_NAME]
-                unique_id = generate_unique_id(name)
-                await self.async_set_unique_id(unique_id)
-                self._abort_if_unique_id_configured()
-                
-                # Create entry
-                data = {
-                    CONF_NAME: name,
-                    CONF_CONTROL_METHOD: CONTROL_METHOD_EXISTING_COVER,
-                    CONF_COVER_ENTITY_ID: cover_entity,
-                    CONF_OPENING_TIME_MAP: opening_map,
-                    CONF_CLOSING_TIME_MAP: closing_map,
-                    CONF_TILTING_TIME_DOWN: tilt_down,
-                    CONF_TILTING_TIME_UP: tilt_up,
-                    CONF_DEVICE_CLASS: user_input.get(CONF_DEVICE_CLASS, ""),
-                }
                 
-                return self.async_create_entry(title=name, data=data)
-                
-            except vol.Invalid as err:
+            except (_ConfigInvalid, vol.Invalid) as err:
                 errors["base"] = str(err)
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected error in advanced existing cover config")
@@ -732,39 +763,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="existing_cover_advanced",
-            data_schema=vol.Schema({
-                vol.Required(CONF_NAME): str,
-                vol.Required(CONF_COVER_ENTITY_ID): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=["cover"])
-                ),
-                vol.Required(
-                    CONF_OPENING_TIME_MAP,
-                    default=format_time_map_for_ui(DEFAULT_OPENING_TIME_MAP)
-                ): str,
-                vol.Required(
-                    CONF_CLOSING_TIME_MAP,
-                    default=format_time_map_for_ui(DEFAULT_CLOSING_TIME_MAP)
-                ): str,
-                vol.Optional(CONF_TILTING_TIME_DOWN): str,
-                vol.Optional(CONF_TILTING_TIME_UP): str,
-                vol.Optional(CONF_DEVICE_CLASS): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            {"value": "", "label": "Auto-detect (Blind if tilt, Shade if not)"},
-                            {"value": "awning", "label": "Awning"},
-                            {"value": "blind", "label": "Blind"},
-                            {"value": "curtain", "label": "Curtain"},
-                            {"value": "damper", "label": "Damper"},
-                            {"value": "door", "label": "Door"},
-                            {"value": "garage", "label": "Garage"},
-                            {"value": "gate", "label": "Gate"},
-                            {"value": "shade", "label": "Shade"},
-                            {"value": "shutter", "label": "Shutter"},
-                            {"value": "window", "label": "Window"},
-                        ]
-                    )
-                ),
-            }),
+            data_schema=_SETUP_SCHEMAS[CONTROL_METHOD_EXISTING_COVER, CONFIG_MODE_ADVANCED],
             errors=errors,
         )
 
@@ -776,36 +775,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                # Validate cover entity
-                cover_entity = user_input[CONF_COVER_ENTITY_ID]
-                if self.hass.states.get(cover_entity) is None:
-                    raise vol.Invalid(f"Cover entity '{cover_entity}' not found")
-                
-                # Use default time maps for automatic setup
-                opening_map = DEFAULT_OPENING_TIME_MAP.copy()
-                closing_map = DEFAULT_CLOSING_TIME_MAP.copy()
-                
-                # Check for existing entry with same name
-                name = user_input[CONF_NAME]
-                unique_id = generate_unique_id(name)
-                await self.async_set_unique_id(unique_id)
-                self._abort_if_unique_id_configured()
-                
-                # Create entry
-                data = {
-                    CONF_NAME: name,
-                    CONF_CONTROL_METHOD: CONTROL_METHOD_EXISTING_COVER,
-                    CONF_COVER_ENTITY_ID: cover_entity,
-                    CONF_OPENING_TIME_MAP: opening_map,
-                    CONF_CLOSING_TIME_MAP: closing_map,
-                    CONF_TILTING_TIME_DOWN: None,
-                    CONF_TILTING_TIME_UP: None,
-                    CONF_DEVICE_CLASS: user_input.get(CONF_DEVICE_CLASS, ""),
-                }
-                
-                return self.async_create_entry(title=name, data=data)
+                return await self._async_create_cover_entry(
+                    user_input, CONTROL_METHOD_EXISTING_COVER, CONFIG_MODE_AUTOMATIC
+                )
                 
-            except vol.Invalid as err:
+            except (_ConfigInvalid, vol.Invalid) as err:
                 errors["base"] = str(err)
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected error in automatic existing cover config")
@@ -813,12 +787,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="existing_cover_automatic",
-            data_schema=vol.Schema({
-                vol.Required(CONF_NAME): str,
-                vol.Required(CONF_COVER_ENTITY_ID): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=["cover"])
-                ),
-            }),
+            data_schema=_SETUP_SCHEMAS[CONTROL_METHOD_EXISTING_COVER, CONFIG_MODE_AUTOMATIC],
             errors=errors,
         )
 
@@ -829,6 +798,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         config_entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
         if not config_entry:
             return self.async_abort(reason="entry_not_found")
+        # The method-specific steps and their form submits reuse this lookup
+        self._reconfigure_config_entry = config_entry
         
         current_data = config_entry.data
         control_method = current_data.get(CONF_CONTROL_METHOD, CONTROL_METHOD_SWITCHES)
@@ -842,54 +813,18 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle reconfiguration for switch-based covers."""
-        config_entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
-        current_data = config_entry.data
+        config_entry = self._reconfigure_config_entry or (
+            self.hass.config_entries.async_get_entry(self.context["entry_id"])
+        )
         errors: dict[str, str] = {}
 
         if user_input is not None:
             try:
-                # Validate entities
-                open_entity = user_input[CONF_OPEN_SWITCH_ENTITY_ID]
-                close_entity = user_input[CONF_CLOSE_SWITCH_ENTITY_ID]
-                stop_entity = user_input.get(CONF_STOP_SWITCH_ENTITY_ID)
-                
-                if self.hass.states.get(open_entity) is None:
-                    raise vol.Invalid(f"Open entity '{open_entity}' not found")
-                if self.hass.states.get(close_entity) is None:
-                    raise vol.Invalid(f"Close entity '{close_entity}' not found")
-                if stop_entity and self.hass.states.get(stop_entity) is None:
-                    raise vol.Invalid(f"Stop entity '{stop_entity}' not found")
-                
-                # Validate time maps
-                opening_map = TimeMapValidator.validate_time_map(
-                    user_input[CONF_OPENING_TIME_MAP], "Opening"
-                )
-                closing_map = TimeMapValidator.validate_time_map(
-                    user_input[CONF_CLOSING_TIME_MAP], "Closing"
+                return self._async_apply_reconfigure(
+                    config_entry, user_input, CONTROL_METHOD_SWITCHES
                 )
                 
-                # Validate tilt times
-                tilt_down = validate_tilt_time(user_input.get(CONF_TILTING_TIME_DOWN))
-                tilt_up = validate_tilt_time(user_input.get(CONF_TILTING_TIME_UP))
-                
-                # Update entry
-                new_data = {
-                    **current_data,
-                    CONF_NAME: user_input[CONF_NAME],
-                    CONF_OPEN_SWITCH_ENTITY_ID: open_entity,
-                    CONF_CLOSE_SWITCH_ENTITY_ID: close_entity,
-                    CONF_STOP_SWITCH_ENTITY_ID: stop_entity,
-                    CONF_IS_BUTTON: user_input.get(CONF_IS_BUTTON, False),
-                    CONF_OPENING_TIME_MAP: opening_map,
-                    CONF_CLOSING_TIME_MAP: closing_map,
-                    CONF_TILTING_TIME_DOWN: tilt_down,
-                    CONF_TILTING_TIME_UP: tilt_up,
-                }
-                
-                self.hass.config_entries.async_update_entry(config_entry, data=new_data)
-                return self.async_abort(reason="reconfigure_successful")
-                
-            except vol.Invalid as err:
+            except (_ConfigInvalid, vol.Invalid) as err:
                 errors["base"] = str(err)
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected error in reconfigure switches")
@@ -897,53 +832,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reconfigure_switches",
-            data_schema=vol.Schema({
-                vol.Required(CONF_NAME, default=current_data.get(CONF_NAME, "")): str,
-                vol.Required(
-                    CONF_OPEN_SWITCH_ENTITY_ID,
-                    default=current_data.get(CONF_OPEN_SWITCH_ENTITY_ID, "")
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["switch", "script", "automation", "input_boolean", "button"]
-                    )
-                ),
-                vol.Required(
-                    CONF_CLOSE_SWITCH_ENTITY_ID,
-                    default=current_data.get(CONF_CLOSE_SWITCH_ENTITY_ID, "")
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["switch", "script", "automation", "input_boolean", "button"]
-                    )
-                ),
-                vol.Optional(
-                    CONF_STOP_SWITCH_ENTITY_ID,
-                    default=current_data.get(CONF_STOP_SWITCH_ENTITY_ID)
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain=["switch", "script", "automation", "input_boolean", "button"]
-                    )
-                ),
-                vol.Optional(
-                    CONF_IS_BUTTON,
-                    default=current_data.get(CONF_IS_BUTTON, False)
-                ): bool,
-                vol.Required(
-                    CONF_OPENING_TIME_MAP,
-                    default=format_time_map_for_ui(current_data.get(CONF_OPENING_TIME_MAP, DEFAULT_OPENING_TIME_MAP))
-                ): str,
-                vol.Required(
-                    CONF_CLOSING_TIME_MAP,
-                    default=format_time_map_for_ui(current_data.get(CONF_CLOSING_TIME_MAP, DEFAULT_CLOSING_TIME_MAP))
-                ): str,
-                vol.Optional(
-                    CONF_TILTING_TIME_DOWN,
-                    default=str(current_data.get(CONF_TILTING_TIME_DOWN, "")) if current_data.get(CONF_TILTING_TIME_DOWN) else ""
-                ): str,
-                vol.Optional(
-                    CONF_TILTING_TIME_UP,
-                    default=str(current_data.get(CONF_TILTING_TIME_UP, "")) if current_data.get(CONF_TILTING_TIME_UP) else ""
-                ): str,
-            }),
+            data_schema=self.add_suggested_values_to_schema(
+                _RECONFIGURE_SCHEMAS[CONTROL_METHOD_SWITCHES],
+                _reconfigure_suggested_values(config_entry.data),
+            ),
             errors=errors,
         )
 
@@ -951,44 +843,18 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle reconfiguration for existing cover."""
-        config_entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
-        current_data = config_entry.data
+        config_entry = self._reconfigure_config_entry or (
+            self.hass.config_entries.async_get_entry(self.context["entry_id"])
+        )
         errors: dict[str, str] = {}
 
         if user_input is not None:
             try:
-                # Validate cover entity
-                cover_entity = user_input[CONF_COVER_ENTITY_ID]
-                if self.hass.states.get(cover_entity) is None:
-                    raise vol.Invalid(f"Cover entity '{cover_entity}' not found")
-                
-                # Validate time maps
-                opening_map = TimeMapValidator.validate_time_map(
-                    user_input[CONF_OPENING_TIME_MAP], "Opening"
-                )
-                closing_map = TimeMapValidator.validate_time_map(
-                    user_input[CONF_CLOSING_TIME_MAP], "Closing"
+                return self._async_apply_reconfigure(
+                    config_entry, user_input, CONTROL_METHOD_EXISTING_COVER
                 )
                 
-                # Validate tilt times
-                tilt_down = validate_tilt_time(user_input.get(CONF_TILTING_TIME_DOWN))
-                tilt_up = validate_tilt_time(user_input.get(CONF_TILTING_TIME_UP))
-                
-                # Update entry
-                new_data = {
-                    **current_data,
-                    CONF_NAME: user_input[CONF_NAME],
-                    CONF_COVER_ENTITY_ID: cover_entity,
-                    CONF_OPENING_TIME_MAP: opening_map,
-                    CONF_CLOSING_TIME_MAP: closing_map,
-                    CONF_TILTING_TIME_DOWN: tilt_down,
-                    CONF_TILTING_TIME_UP: tilt_up,
-                }
-                
-                self.hass.config_entries.async_update_entry(config_entry, data=new_data)
-                return self.async_abort(reason="reconfigure_successful")
-                
-            except vol.Invalid as err:
+            except (_ConfigInvalid, vol.Invalid) as err:
                 errors["base"] = str(err)
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected error in reconfigure existing cover")
@@ -996,31 +862,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reconfigure_existing_cover",
-            data_schema=vol.Schema({
-                vol.Required(CONF_NAME, default=current_data.get(CONF_NAME, "")): str,
-                vol.Required(
-                    CONF_COVER_ENTITY_ID,
-                    default=current_data.get(CONF_COVER_ENTITY_ID, "")
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(domain=["cover"])
-                ),
-                vol.Required(
-                    CONF_OPENING_TIME_MAP,
-                    default=format_time_map_for_ui(current_data.get(CONF_OPENING_TIME_MAP, DEFAULT_OPENING_TIME_MAP))
-                ): str,
-                vol.Required(
-                    CONF_CLOSING_TIME_MAP,
-                    default=format_time_map_for_ui(current_data.get(CONF_CLOSING_TIME_MAP, DEFAULT_CLOSING_TIME_MAP))
-                ): str,
-                vol.Optional(
-                    CONF_TILTING_TIME_DOWN,
-                    default=str(current_data.get(CONF_TILTING_TIME_DOWN, "")) if current_data.get(CONF_TILTING_TIME_DOWN) else ""
-                ): str,
-                vol.Optional(
-                    CONF_TILTING_TIME_UP,
-                    default=str(current_data.get(CONF_TILTING_TIME_UP, "")) if current_data.get(CONF_TILTING_TIME_UP) else ""
-                ): str,
-            }),
+            data_schema=self.add_suggested_values_to_schema(
+                _RECONFIGURE_SCHEMAS[CONTROL_METHOD_EXISTING_COVER],
+                _reconfigure_suggested_values(config_entry.data),
+            ),
             errors=errors,
         )
 
@@ -1053,37 +898,29 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 tilt_up = validate_tilt_time(user_input.get(CONF_TILTING_TIME_UP))
                 
                 # Update config entry data (not options)
-                new_data = {
-                    **self.config_entry.data,
-                    CONF_TILTING_TIME_DOWN: tilt_down,
-                    CONF_TILTING_TIME_UP: tilt_up,
-                }
-                
-                self.hass.config_entries.async_update_entry(
-                    self.config_entry, data=new_data
+                _async_update_entry_data(
+                    self.hass,
+                    self.config_entry,
+                    {CONF_TILTING_TIME_DOWN: tilt_down, CONF_TILTING_TIME_UP: tilt_up},
                 )
                 
                 return self.async_create_entry(title="", data={})
                 
-            except vol.Invalid as err:
+            except (_ConfigInvalid, vol.Invalid) as err:
                 errors["base"] = str(err)
             except Exception as err:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected error in options flow")
                 errors["base"] = f"unexpected_error: {err}"
 
-        current_data = self.config_entry.data
-        
+        data = self.config_entry.data
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({
-                vol.Optional(
-                    CONF_TILTING_TIME_DOWN,
-                    default=str(current_data.get(CONF_TILTING_TIME_DOWN, "")) if current_data.get(CONF_TILTING_TIME_DOWN) else ""
-                ): str,
-                vol.Optional(
-                    CONF_TILTING_TIME_UP,
-                    default=str(current_data.get(CONF_TILTING_TIME_UP, "")) if current_data.get(CONF_TILTING_TIME_UP) else ""
-                ): str,
-            }),
+            data_schema=self.add_suggested_values_to_schema(
+                _OPTIONS_SCHEMA,
+                {
+                    CONF_TILTING_TIME_DOWN: _tilt_default(data, CONF_TILTING_TIME_DOWN),
+                    CONF_TILTING_TIME_UP: _tilt_default(data, CONF_TILTING_TIME_UP),
+                },
+            ),
             errors=errors,
         )
\ No newline at end of file
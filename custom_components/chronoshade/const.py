@@ -21,6 +21,11 @@ CONF_DEVICE_CLASS = "device_class"
 CONTROL_METHOD_SWITCHES = "switches"
 CONTROL_METHOD_EXISTING_COVER = "existing_cover"
 
+# Configuration modes
+CONFIG_MODE_STANDARD = "standard"
+CONFIG_MODE_ADVANCED = "advanced"
+CONFIG_MODE_AUTOMATIC = "automatic"
+
 # Default values
 DEFAULT_TILT_TIME = 5.0
 DEFAULT_OPENING_TIME_MAP = {0.0: 0, 10.0: 100}
@@ -1,14 +1,15 @@
 """ChronoShade - Precision time-based cover control with position-time maps"""
 
 import logging
-import re
+import time
 from asyncio import sleep
+from bisect import bisect_left
 from datetime import timedelta
+from operator import neg
 from typing import Dict, Optional, Tuple
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
-from homeassistant.util import dt as dt_util
 from homeassistant.components.cover import (
     ATTR_CURRENT_POSITION,
     ATTR_CURRENT_TILT_POSITION,
@@ -56,6 +57,7 @@ from .const import (
     MANUFACTURER,
     MODEL,
 )
+from .util import slugify_name
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -126,6 +128,12 @@ class PositionCalculator:
         self._opening_time_map = self._validate_and_sort_time_map(opening_time_map, "opening")
         self._closing_time_map = self._validate_and_sort_time_map(closing_time_map, "closing")
         
+        # Parallel time/position tuples so lookups never re-extract the maps
+        self._opening_times = tuple(self._opening_time_map)
+        self._opening_positions = tuple(self._opening_time_map.values())
+        self._closing_times = tuple(self._closing_time_map)
+        self._closing_positions = tuple(self._closing_time_map.values())
+        
         self._current_position = 0  # 0 = closed, 100 = open
         self._is_moving = False
         self._movement_start_time = None
@@ -174,9 +182,10 @@ class PositionCalculator:
             _LOGGER.info(f"Auto-corrected {map_type} time map: {sorted_map}")
         
         # Validate position range
-        for pos in positions:
-            if not 0 <= pos <= 100:
-                raise vol.Invalid(f"Position {pos} in {map_type} time map must be between 0 and 100")
+        lowest, highest = min(positions), max(positions)
+        if lowest < 0 or highest > 100:
+            bad = next(pos for pos in positions if not 0 <= pos <= 100)
+            raise vol.Invalid(f"Position {bad} in {map_type} time map must be between 0 and 100")
         
         # Validate start/end positions
         if map_type == "opening":
@@ -190,79 +199,61 @@ class PositionCalculator:
             if positions[-1] != 0:
                 raise vol.Invalid("Closing time map must end at position 0 (closed)")
         
-        # Validate monotonic progression
+        # Validate monotonic progression, carrying the previous position
+        prev_pos = positions[0]
         if map_type == "opening":
-            for i in range(1, len(positions)):
-                if positions[i] < positions[i-1]:
+            for pos in positions:
+                if pos < prev_pos:
                     raise vol.Invalid("Opening time map positions must be non-decreasing")
+                prev_pos = pos
         else:  # closing
-            for i in range(1, len(positions)):
-                if positions[i] > positions[i-1]:
+            for pos in positions:
+                if pos > prev_pos:
                     raise vol.Invalid("Closing time map positions must be non-increasing")
+                prev_pos = pos
         
         return sorted_map
     
-    def _interpolate_position(self, elapsed_time: float, time_map: Dict[float, int]) -> int:
-        """Interpolate position based on elapsed time and time map."""
-        times = list(time_map.keys())
-        positions = list(time_map.values())
-        
-        # If elapsed time is before first time point
-        if elapsed_time <= times[0]:
-            return positions[0]
-        
-        # If elapsed time is after last time point
-        if elapsed_time >= times[-1]:
-            return positions[-1]
-        
-        # Find the two time points to interpolate between
-        for i in range(len(times) - 1):
-            if times[i] <= elapsed_time <= times[i + 1]:
-                # Linear interpolation
-                time_diff = times[i + 1] - times[i]
-                pos_diff = positions[i + 1] - positions[i]
-                time_ratio = (elapsed_time - times[i]) / time_diff
-                interpolated_pos = positions[i] + (pos_diff * time_ratio)
-                return round(interpolated_pos)
-        
-        return positions[-1]
-    
-    def _find_time_for_position(self, target_position: int, time_map: Dict[float, int]) -> float:
+    def _find_time_for_position(
+        self, target_position: int, times: Tuple[float, ...], positions: Tuple[int, ...]
+    ) -> float:
         """Find the time needed to reach a target position."""
-        times = list(time_map.keys())
-        positions = list(time_map.values())
+        # Positions are monotonic, so binary search them; closing maps
+        # descend and are searched on their negated values
+        if positions[0] <= positions[-1]:
+            idx = bisect_left(positions, target_position)
+        else:
+            idx = bisect_left(positions, -target_position, key=neg)
+        
+        # Target position not reachable
+        if idx == len(positions):
+            return times[-1]
         
         # If target is at a defined position
-        if target_position in positions:
-            idx = positions.index(target_position)
+        if positions[idx] == target_position:
             return times[idx]
         
-        # Find the two positions to interpolate between
-        for i in range(len(positions) - 1):
-            pos1, pos2 = positions[i], positions[i + 1]
-            if min(pos1, pos2) <= target_position <= max(pos1, pos2):
-                # Linear interpolation to find time
-                time1, time2 = times[i], times[i + 1]
-                pos_diff = pos2 - pos1
-                if pos_diff == 0:  # Same position
-                    return time1
-                time_diff = time2 - time1
-                pos_ratio = (target_position - pos1) / pos_diff
-                interpolated_time = time1 + (time_diff * pos_ratio)
-                return interpolated_time
-        
         # Target position not reachable
-        return times[-1]
+        if idx == 0:
+            return times[-1]
+        
+        # Linear interpolation to find time
+        pos1, pos2 = positions[idx - 1], positions[idx]
+        time1, time2 = times[idx - 1], times[idx]
+        time_diff = time2 - time1
+        pos_ratio = (target_position - pos1) / (pos2 - pos1)
+        interpolated_time = time1 + (time_diff * pos_ratio)
+        return interpolated_time
     
     def _calculate_movement_duration(self, start_pos: int, target_pos: int, direction: str) -> float:
         """Calculate how long the movement should take based on the time map."""
         if direction == "opening":
-            time_map = self._opening_time_map
+            times, positions = self._opening_times, self._opening_positions
         else:
-            time_map = self._closing_time_map
+            times, positions = self._closing_times, self._closing_positions
         
-        start_time = self._find_time_for_position(start_pos, time_map)
-        target_time = self._find_time_for_position(target_pos, time_map)
+        start_time = self._find_time_for_position(start_pos, times, positions)
+        target_time = self._find_time_for_position(target_pos, times, positions)
         
         return abs(target_time - start_time)
     
@@ -273,7 +264,7 @@ class PositionCalculator:
         
         self._is_moving = True
         self._movement_direction = "opening"
-        self._movement_start_time = dt_util.utcnow().timestamp()
+        self._movement_start_time = time.monotonic()
         self._start_position = self._current_position
         self._target_position = target_position
         self._movement_duration = self._calculate_movement_duration(
@@ -289,7 +280,7 @@ class PositionCalculator:
         
         self._is_moving = True
         self._movement_direction = "closing"
-        self._movement_start_time = dt_util.utcnow().timestamp()
+        self._movement_start_time = time.monotonic()
         self._start_position = self._current_position
         self._target_position = target_position
         self._movement_duration = self._calculate_movement_duration(
@@ -303,7 +294,7 @@ class PositionCalculator:
         if not self._is_moving:
             return self._current_position
         
-        elapsed_time = dt_util.utcnow().timestamp() - self._movement_start_time
+        elapsed_time = time.monotonic() - self._movement_start_time
         
         # Calculate progress as a ratio (0.0 to 1.0)
         if self._movement_duration > 0:
@@ -330,7 +321,7 @@ class PositionCalculator:
         current_pos = self.get_current_position()
         
         # Check if we've reached the target position or time
-        elapsed_time = dt_util.utcnow().timestamp() - self._movement_start_time
+        elapsed_time = time.monotonic() - self._movement_start_time
         time_reached = elapsed_time >= self._movement_duration
         
         if self._movement_direction == "opening":
@@ -378,6 +369,7 @@ class TiltCalculator:
         self._movement_start_time = None
         self._movement_direction = None
         self._target_position = None
+        self._start_position = None  # Tilt when movement started
     
     def start_opening(self, target_position: int = 100):
         """Start opening tilt."""
@@ -386,7 +378,8 @@ class TiltCalculator:
         
         self._is_moving = True
         self._movement_direction = "opening"
-        self._movement_start_time = dt_util.utcnow().timestamp()
+        self._movement_start_time = time.monotonic()
+        self._start_position = self._current_position
         self._target_position = target_position
     
     def start_closing(self, target_position: int = 0):
@@ -396,7 +389,8 @@ class TiltCalculator:
         
         self._is_moving = True
         self._movement_direction = "closing"
-        self._movement_start_time = dt_util.utcnow().timestamp()
+        self._movement_start_time = time.monotonic()
+        self._start_position = self._current_position
         self._target_position = target_position
     
     def get_current_position(self) -> int:
@@ -404,16 +398,16 @@ class TiltCalculator:
         if not self._is_moving:
             return self._current_position
         
-        elapsed_time = dt_util.utcnow().timestamp() - self._movement_start_time
+        elapsed_time = time.monotonic() - self._movement_start_time
         
         if self._movement_direction == "opening":
             total_time = self._tilt_time_up
-            progress = min(elapsed_time / total_time, 1.0)
-            new_position = self._current_position + (self._target_position - self._current_position) * progress
         else:  # closing
             total_time = self._tilt_time_down
-            progress = min(elapsed_time / total_time, 1.0)
-            new_position = self._current_position + (self._target_position - self._current_position) * progress
+        progress = min(elapsed_time / total_time, 1.0)
+        
+        # Measure from the start position so repeated reads agree
+        new_position = self._start_position + (self._target_position - self._start_position) * progress
         
         self._current_position = round(new_position)
         return self._current_position
@@ -438,6 +432,7 @@ class TiltCalculator:
             self._movement_start_time = None
             self._movement_direction = None
             self._target_position = None
+            self._start_position = None
     
     def set_position(self, position: int):
         """Set known tilt position."""
@@ -485,8 +480,6 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Cover Time Based from a config entry."""
-    config = config_entry.data
-    
     # Create cover entity from config entry
     cover = CoverTimeBased(
         config_entry=config_entry,
@@ -537,7 +530,7 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
         
         # Basic configuration
         self._name = config[CONF_NAME]
-        self._unique_id = re.sub(r'[^a-z0-9_]', '_', self._name.lower())
+        self._unique_id = slugify_name(self._name)
         self._device_id = config_entry.entry_id
         
         # Control method
@@ -552,9 +545,24 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
         # Initialize tilt calculator if supported
         self._tilt_time_down = config.get(CONF_TILTING_TIME_DOWN)
         self._tilt_time_up = config.get(CONF_TILTING_TIME_UP)
-        if self._has_tilt_support():
+        self._has_tilt_support = (
+            self._tilt_time_down is not None and self._tilt_time_up is not None
+        )
+        if self._has_tilt_support:
             self.tilt_calc = TiltCalculator(self._tilt_time_down, self._tilt_time_up)
         
+        # Features only depend on tilt support, which is fixed for the entity
+        supported_features = (
+            CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE | 
+            CoverEntityFeature.STOP | CoverEntityFeature.SET_POSITION
+        )
+        if self._has_tilt_support:
+            supported_features |= (
+                CoverEntityFeature.OPEN_TILT | CoverEntityFeature.CLOSE_TILT | 
+                CoverEntityFeature.STOP_TILT | CoverEntityFeature.SET_TILT_POSITION
+            )
+        self._attr_supported_features = supported_features
+        
         # Device class configuration (with backward compatibility)
         self._device_class = config.get(CONF_DEVICE_CLASS, "")
         
@@ -573,6 +581,7 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
             self._is_button = False
         
         self._unsubscribe_auto_updater = None
+        self._last_reported_position = None
     
     async def async_added_to_hass(self):
         """Restore previous state."""
@@ -583,7 +592,7 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
             position = int(old_state.attributes.get(ATTR_CURRENT_POSITION))
             self.position_calc.set_position(position)
             
-            if (self._has_tilt_support() and 
+            if (self._has_tilt_support and 
                 old_state.attributes.get(ATTR_CURRENT_TILT_POSITION) is not None):
                 tilt_position = int(old_state.attributes.get(ATTR_CURRENT_TILT_POSITION))
                 self.tilt_calc.set_position(tilt_position)
@@ -626,7 +635,7 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
                     return self._device_class
             
             # Auto-detect based on tilt support
-            if self._has_tilt_support():
+            if self._has_tilt_support:
                 # Blinds commonly have tilt functionality
                 return CoverDeviceClass.BLIND
             else:
@@ -650,7 +659,7 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
     @property
     def current_cover_tilt_position(self) -> int | None:
         """Return the current tilt of the cover."""
-        if self._has_tilt_support():
+        if self._has_tilt_support:
             return self.tilt_calc.get_current_position()
         return None
     
@@ -659,7 +668,7 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
         """Return if the cover is opening or not."""
         return (self.position_calc.is_moving() and 
                 self.position_calc._movement_direction == "opening") or \
-               (self._has_tilt_support() and self.tilt_calc.is_moving() and 
+               (self._has_tilt_support and self.tilt_calc.is_moving() and 
                 self.tilt_calc._movement_direction == "opening")
     
     @property
@@ -667,7 +676,7 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
         """Return if the cover is closing or not."""
         return (self.position_calc.is_moving() and 
                 self.position_calc._movement_direction == "closing") or \
-               (self._has_tilt_support() and self.tilt_calc.is_moving() and 
+               (self._has_tilt_support and self.tilt_calc.is_moving() and 
                 self.tilt_calc._movement_direction == "closing")
     
     @property
@@ -680,22 +689,6 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
         """Return True because covers can be stopped midway."""
         return True
     
-    @property
-    def supported_features(self) -> CoverEntityFeature:
-        """Flag supported features."""
-        supported_features = (
-            CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE | 
-            CoverEntityFeature.STOP | CoverEntityFeature.SET_POSITION
-        )
-        
-        if self._has_tilt_support():
-            supported_features |= (
-                CoverEntityFeature.OPEN_TILT | CoverEntityFeature.CLOSE_TILT | 
-                CoverEntityFeature.STOP_TILT | CoverEntityFeature.SET_TILT_POSITION
-            )
-        
-        return supported_features
-    
     async def async_set_cover_position(self, **kwargs):
         """Move the cover to a specific position."""
         if ATTR_POSITION in kwargs:
@@ -733,7 +726,7 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
     async def async_close_cover_tilt(self, **kwargs):
         """Close the cover tilt."""
         _LOGGER.debug("async_close_cover_tilt")
-        if self._has_tilt_support():
+        if self._has_tilt_support:
             current_position = self.tilt_calc.get_current_position()
             if current_position > 0:
                 self.tilt_calc.start_closing()
@@ -743,7 +736,7 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
     async def async_open_cover_tilt(self, **kwargs):
         """Open the cover tilt."""
         _LOGGER.debug("async_open_cover_tilt")
-        if self._has_tilt_support():
+        if self._has_tilt_support:
             current_position = self.tilt_calc.get_current_position()
             if current_position < 100:
                 self.tilt_calc.start_opening()
@@ -784,7 +777,7 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
     
     async def set_tilt_position(self, position):
         """Move cover tilt to a designated position."""
-        if not self._has_tilt_support():
+        if not self._has_tilt_support:
             return
         
         _LOGGER.debug("set_tilt_position to %d", position)
@@ -806,7 +799,7 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
             self.position_calc.stop()
             self.stop_auto_updater()
         
-        if self._has_tilt_support() and self.tilt_calc.is_moving():
+        if self._has_tilt_support and self.tilt_calc.is_moving():
             _LOGGER.debug("_handle_stop :: stopping tilt movement")
             self.tilt_calc.stop()
             self.stop_auto_updater()
@@ -814,6 +807,8 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
     def start_auto_updater(self):
         """Start the autoupdater to update HASS while cover is moving."""
         _LOGGER.debug("start_auto_updater")
+        # A new movement always gets its first tick written
+        self._last_reported_position = None
         if self._unsubscribe_auto_updater is None:
             _LOGGER.debug("init _unsubscribe_auto_updater")
             interval = timedelta(seconds=0.1)
@@ -825,11 +820,20 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
     def auto_updater_hook(self, now):
         """Call for the autoupdater."""
         _LOGGER.debug("auto_updater_hook")
-        self.async_schedule_update_ha_state()
+        # Slow travel often rounds to the same state on consecutive ticks
+        reported = (
+            self.current_cover_position,
+            self.current_cover_tilt_position,
+            self.is_opening,
+            self.is_closing,
+        )
+        if reported != self._last_reported_position:
+            self._last_reported_position = reported
+            self.async_schedule_update_ha_state()
         if self.position_reached():
             _LOGGER.debug("auto_updater_hook :: position_reached")
             self.stop_auto_updater()
-        self.hass.async_create_task(self.auto_stop_if_necessary())
+            self.hass.async_create_task(self.auto_stop_if_necessary())
     
     def stop_auto_updater(self):
         """Stop the autoupdater."""
@@ -841,16 +845,12 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
     def position_reached(self):
         """Return if cover has reached its final position."""
         return self.position_calc.has_reached_target() and (
-            not self._has_tilt_support() or self.tilt_calc.has_reached_target()
+            not self._has_tilt_support or self.tilt_calc.has_reached_target()
         )
     
-    def _has_tilt_support(self):
-        """Return if cover has tilt support."""
-        return self._tilt_time_down is not None and self._tilt_time_up is not None
-    
     def _update_tilt_before_travel(self, command):
         """Updating tilt before travel."""
-        if self._has_tilt_support():
+        if self._has_tilt_support:
             _LOGGER.debug("_update_tilt_before_travel :: command %s", command)
             if command == SERVICE_OPEN_COVER:
                 self.tilt_calc.set_position(0)
@@ -862,7 +862,7 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
         if self.position_reached():
             _LOGGER.debug("auto_stop_if_necessary :: calling stop command")
             self.position_calc.stop()
-            if self._has_tilt_support():
+            if self._has_tilt_support:
                 self.tilt_calc.stop()
             await self._async_handle_command(SERVICE_STOP_COVER)
     
@@ -875,7 +875,7 @@ class CoverTimeBased(CoverEntity, RestoreEntity):
     
     async def set_known_tilt_position(self, **kwargs):
         """Set a known tilt position for the cover."""
-        if not self._has_tilt_support():
+        if not self._has_tilt_support:
             return
         position = kwargs[ATTR_TILT_POSITION]
         await self._async_handle_command(SERVICE_STOP_COVER)
@@ -0,0 +1,20 @@
+"""Shared helpers for ChronoShade integration."""
+from __future__ import annotations
+
+import re
+import string
+
+_SLUG_RE = re.compile(r"[^a-z0-9_]")
+# ASCII names skip the regex engine; anything else falls back to the pattern
+_SLUG_ALLOWED = frozenset(string.ascii_lowercase + string.digits + "_")
+_SLUG_TABLE = str.maketrans(
+    {chr(code): "_" for code in range(128) if chr(code) not in _SLUG_ALLOWED}
+)
+
+
+def slugify_name(name: str) -> str:
+    """Convert an entry name into its unique_id form."""
+    slug = name.lower()
+    if slug.isascii():
+        return slug.translate(_SLUG_TABLE)
+    return _SLUG_RE.sub("_", slug)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Tests for the ChronoShade config flow."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.chronoshade.config_flow import (
+    ConfigFlow,
+    TimeMapValidator,
+    _reconfigure_suggested_values,
+    _validate_time_map_cached,
+    format_time_map_for_ui,
+    validate_tilt_time,
+)
+from custom_components.chronoshade.const import (
+    CONF_CLOSING_TIME_MAP,
+    CONF_IS_BUTTON,
+    CONF_OPENING_TIME_MAP,
+    CONF_TILTING_TIME_DOWN,
+    CONF_TILTING_TIME_UP,
+)
+
+
+def _make_flow(known_entities):
+    """Build a config flow whose hass only knows the given entities."""
+    flow = ConfigFlow()
+    flow.hass = MagicMock()
+    flow.hass.states.get = lambda entity_id: (
+        MagicMock() if entity_id in known_entities else None
+    )
+    return flow
+
+
+@pytest.mark.parametrize("value", [None, "", "   ", 0])
+def test_tilt_time_unset(value):
+    """Blank or zero tilt times mean no tilt support."""
+    assert validate_tilt_time(value) is None
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("1.5", 1.5), (" 2 ", 2.0), ("1e1", 10.0), (".5", 0.5), (300, 300.0), (2.5, 2.5)],
+)
+def test_tilt_time_valid(value, expected):
+    """Anything float() accepts converts to seconds."""
+    assert validate_tilt_time(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value, message",
+    [
+        ("abc", "Invalid tilt time"),
+        ([1], "Invalid tilt time"),
+        ("nan", "finite"),
+        ("inf", "finite"),
+        ("-1", "positive"),
+        ("301", "cannot exceed 300"),
+    ],
+)
+def test_tilt_time_invalid(value, message):
+    """Bad tilt times raise with a message for the form."""
+    with pytest.raises(ValueError, match=message):
+        validate_tilt_time(value)
+
+
+def test_missing_entities_reported_together():
+    """Every missing entity is named in one error."""
+    flow = _make_flow({"switch.open"})
+    with pytest.raises(ValueError) as exc_info:
+        flow._validate_entities_exist(
+            ("Open", "switch.open"),
+            ("Close", "switch.close"),
+            ("Stop", "switch.stop"),
+        )
+    assert str(exc_info.value) == (
+        "Close entity 'switch.close', Stop entity 'switch.stop' not found"
+    )
+
+
+def test_entities_checked_on_every_submit():
+    """An entity removed between submits is caught on the next one."""
+    known = {"switch.open", "switch.close"}
+    flow = _make_flow(known)
+    entities = (("Open", "switch.open"), ("Close", "switch.close"), ("Stop", None))
+    flow._validate_entities_exist(*entities)
+
+    known.discard("switch.close")
+    with pytest.raises(ValueError, match="Close entity 'switch.close' not found"):
+        flow._validate_entities_exist(*entities)
+
+
+def test_format_time_map_for_ui():
+    """Time maps render as spaced JSON with sorted string keys."""
+    assert format_time_map_for_ui({}) == "{}"
+    assert format_time_map_for_ui({10.0: 100, 0.0: 0}) == '{"0.0": 0, "10.0": 100}'
+    assert format_time_map_for_ui({"0": 0, "5": 40}) == '{"0": 0, "5": 40}'
+
+
+@pytest.mark.parametrize(
+    "time_map, map_type",
+    [
+        ({0.0: 0, 4.5: 60, 10.0: 100}, "Opening"),
+        ({0.0: 100, 3.0: 50, 6.0: 50, 9.0: 0}, "Closing"),
+    ],
+)
+def test_time_map_round_trip(time_map, map_type):
+    """A rendered map validates back to the same map, in a fresh dict each time."""
+    text = format_time_map_for_ui(time_map)
+    result = TimeMapValidator.validate_time_map(text, map_type)
+    assert result == time_map
+
+    result[0.0] = 50
+    assert TimeMapValidator.validate_time_map(text, map_type) == time_map
+
+
+@pytest.mark.parametrize(
+    "text, map_type, message",
+    [
+        ("", "Opening", "cannot be empty"),
+        ("{}", "Opening", "cannot be empty"),
+        ("[1, 2]", "Opening", "must be a JSON object"),
+        ("{0: 0}", "Opening", "Invalid JSON format"),
+        ('{"a": 0}', "Opening", "Invalid time value 'a'"),
+        ('{"0": 0, "5": 101}', "Opening", "between 0 and 100"),
+        ('{"1": 0, "5": 100}', "Opening", "must start at time 0"),
+        ('{"0": 0, "5": 90}', "Opening", "must end at position 100"),
+        ('{"0": 0, "3": 60, "5": 40, "9": 100}', "Opening", "non-decreasing"),
+        ('{"0": 100, "3": 40, "5": 60, "9": 0}', "Closing", "non-increasing"),
+        ('{"0": 0, "9": 100}', "Closing", "must start at position 100"),
+    ],
+)
+def test_time_map_errors(text, map_type, message):
+    """Invalid maps raise with the message shown on the form."""
+    with pytest.raises(ValueError, match=message):
+        TimeMapValidator.validate_time_map(text, map_type)
+
+
+def test_time_map_error_is_cached():
+    """Resubmitting the same bad map reuses the cached error message."""
+    _validate_time_map_cached.cache_clear()
+    text = '{"0": 0, "5": 90}'
+    for _ in range(2):
+        with pytest.raises(ValueError, match="must end at position 100"):
+            TimeMapValidator.validate_time_map(text, "Opening")
+    info = _validate_time_map_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_oversized_time_map_not_cached():
+    """Oversized input is rejected before it reaches the cache."""
+    _validate_time_map_cached.cache_clear()
+    with pytest.raises(ValueError, match="too large"):
+        TimeMapValidator.validate_time_map(" " * 70000, "Opening")
+    assert _validate_time_map_cached.cache_info().currsize == 0
+
+
+def test_reconfigure_prefills_stored_values():
+    """Reconfigure forms show the stored maps and tilt times as text."""
+    data = {
+        "name": "Blind",
+        CONF_OPENING_TIME_MAP: {"0": 0, "12": 100},
+        CONF_CLOSING_TIME_MAP: {"0": 100, "11": 0},
+        CONF_TILTING_TIME_DOWN: 1.5,
+        CONF_TILTING_TIME_UP: None,
+    }
+    suggested = _reconfigure_suggested_values(data)
+    assert suggested == {
+        "name": "Blind",
+        CONF_IS_BUTTON: False,
+        CONF_OPENING_TIME_MAP: '{"0": 0, "12": 100}',
+        CONF_CLOSING_TIME_MAP: '{"0": 100, "11": 0}',
+        CONF_TILTING_TIME_DOWN: "1.5",
+        CONF_TILTING_TIME_UP: "",
+    }
+
+
+def test_reconfigure_prefills_defaults_for_missing_maps():
+    """Entries without stored maps get the default maps in the form."""
+    suggested = _reconfigure_suggested_values({"name": "Blind"})
+    assert suggested[CONF_OPENING_TIME_MAP] == '{"0.0": 0, "10.0": 100}'
+    assert suggested[CONF_CLOSING_TIME_MAP] == '{"0.0": 100, "10.0": 0}'
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Tests for the ChronoShade cover calculators."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.chronoshade.const import (
+    CONF_CLOSING_TIME_MAP,
+    CONF_OPENING_TIME_MAP,
+    CONF_TILTING_TIME_DOWN,
+    CONF_TILTING_TIME_UP,
+)
+from custom_components.chronoshade.cover import CoverTimeBased, PositionCalculator
+
+MONOTONIC = "custom_components.chronoshade.cover.time.monotonic"
+
+
+def _make_cover(**overrides):
+    """Build a cover entity from plain entry data."""
+    data = {
+        "name": "Test Cover",
+        CONF_OPENING_TIME_MAP: {"0": 0, "10": 100},
+        CONF_CLOSING_TIME_MAP: {"0": 100, "10": 0},
+        CONF_TILTING_TIME_DOWN: 10.0,
+        CONF_TILTING_TIME_UP: 10.0,
+    }
+    data.update(overrides)
+    config_entry = MagicMock()
+    config_entry.data = data
+    hass = MagicMock()
+    hass.async_create_task = lambda coro: coro.close()
+    cover = CoverTimeBased(config_entry, hass)
+    cover.async_schedule_update_ha_state = MagicMock()
+    return cover
+
+
+def _plateau_calc():
+    """Position calculator whose maps both hold a position for a while."""
+    return PositionCalculator(
+        {"0": 0, "3": 20, "5": 20, "10": 100},
+        {"0": 100, "4": 50, "6": 50, "9": 0},
+    )
+
+
+@pytest.mark.parametrize(
+    "position, expected",
+    [(0, 0.0), (10, 1.5), (20, 3.0), (60, 7.5), (100, 10.0)],
+)
+def test_find_time_opening(position, expected):
+    """Opening lookups interpolate and land on the start of a plateau."""
+    calc = _plateau_calc()
+    found = calc._find_time_for_position(
+        position, calc._opening_times, calc._opening_positions
+    )
+    assert found == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "position, expected",
+    [(100, 0.0), (75, 2.0), (50, 4.0), (25, 7.5), (0, 9.0)],
+)
+def test_find_time_closing(position, expected):
+    """Closing maps descend and are searched the same way."""
+    calc = _plateau_calc()
+    found = calc._find_time_for_position(
+        position, calc._closing_times, calc._closing_positions
+    )
+    assert found == pytest.approx(expected)
+
+
+def test_tilt_position_after_several_ticks():
+    """Tilt position depends only on elapsed time, not on how often it is read."""
+    cover = _make_cover()
+    with patch(MONOTONIC, return_value=100.0):
+        cover.tilt_calc.start_opening()
+
+    for now in (101.0, 102.0, 103.0):
+        with patch(MONOTONIC, return_value=now):
+            cover.auto_updater_hook(None)
+
+    with patch(MONOTONIC, return_value=103.0):
+        assert cover.current_cover_tilt_position == 30
+        assert cover.current_cover_tilt_position == 30
+    assert cover.async_schedule_update_ha_state.call_count == 3
+
+
+def test_auto_updater_skips_unchanged_ticks():
+    """Ticks that round to the same state do not write it again."""
+    cover = _make_cover()
+    with patch(MONOTONIC, return_value=100.0):
+        cover.tilt_calc.start_opening()
+
+    for now in (101.0, 101.01, 101.02, 102.0):
+        with patch(MONOTONIC, return_value=now):
+            cover.auto_updater_hook(None)
+
+    assert cover.async_schedule_update_ha_state.call_count == 2
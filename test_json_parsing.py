@@ -3,6 +3,9 @@
 
 import json
 import re
+from ast import literal_eval
+
+_UNQUOTED_KEY_RE = re.compile(r'(\w+)(\s*:\s*)')
 
 def parse_flexible_json(json_str: str) -> dict:
     """Parse JSON with flexible key format (with or without quotes)."""
@@ -19,21 +22,25 @@ def parse_flexible_json(json_str: str) -> dict:
             
             # Replace unquoted keys with quoted keys
             # This regex finds keys that are not quoted
-            fixed_json = re.sub(r'(\w+)(\s*:\s*)', r'"\1"\2', json_str)
+            fixed_json, fixed_count = _UNQUOTED_KEY_RE.subn(r'"\1"\2', json_str)
             
-            # Try parsing the fixed JSON
-            return json.loads(fixed_json)
+            # Re-parse only when keys were quoted; otherwise it fails the same way
+            if fixed_count:
+                # Try parsing the fixed JSON
+                return json.loads(fixed_json)
         except (json.JSONDecodeError, re.error):
-            try:
-                # Last attempt: try eval for Python dict syntax
-                # This is safe because we control the input and only allow dict-like structures
-                result = eval(json_str, {"__builtins__": {}}, {})
-                if isinstance(result, dict):
-                    return result
-                else:
-                    raise ValueError("Input must be a dictionary/object")
-            except Exception as err:
-                raise ValueError(f"Invalid JSON format. Please check syntax: {err}") from err
+            pass
+        
+        try:
+            # Last attempt: parse Python dict syntax as a literal
+            # literal_eval only accepts literals, so no code is executed
+            result = literal_eval(json_str)
+            if isinstance(result, dict):
+                return result
+            else:
+                raise ValueError("Input must be a dictionary/object")
+        except Exception as err:
+            raise ValueError(f"Invalid JSON format. Please check syntax: {err}") from err
 
 def test_json_parsing():
     """Test various JSON formats."""
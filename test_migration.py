@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Tests for ChronoShade config entry migration."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.chronoshade import async_migrate_entry
+from custom_components.chronoshade.const import (
+    CONF_CLOSE_SWITCH_ENTITY_ID,
+    CONF_CONTROL_METHOD,
+    CONF_COVER_ENTITY_ID,
+    CONF_DEVICE_CLASS,
+    CONF_OPEN_SWITCH_ENTITY_ID,
+    CONTROL_METHOD_EXISTING_COVER,
+    CONTROL_METHOD_SWITCHES,
+    CURRENT_CONFIG_VERSION,
+)
+
+SWITCH_DATA = {
+    "name": "Living Room Blind",
+    CONF_OPEN_SWITCH_ENTITY_ID: "switch.blind_open",
+    CONF_CLOSE_SWITCH_ENTITY_ID: "switch.blind_close",
+}
+
+
+def _migrate(version, data, unique_id="old_id"):
+    """Run the migration and return (result, update kwargs or None)."""
+    hass = MagicMock()
+    config_entry = MagicMock(version=version, data=data, unique_id=unique_id)
+    result = asyncio.run(async_migrate_entry(hass, config_entry))
+    update = hass.config_entries.async_update_entry
+    return result, update.call_args.kwargs if update.called else None
+
+
+def test_migrate_from_version_1():
+    """Version 1 entries gain a unique_id, control method and device class."""
+    result, updates = _migrate(1, dict(SWITCH_DATA), unique_id=None)
+    assert result is True
+    assert updates["version"] == CURRENT_CONFIG_VERSION
+    assert updates["unique_id"] == "living_room_blind"
+    assert updates["data"] == {
+        **SWITCH_DATA,
+        CONF_CONTROL_METHOD: CONTROL_METHOD_SWITCHES,
+        CONF_DEVICE_CLASS: "",
+    }
+
+
+def test_migrate_from_version_1_without_name():
+    """A version 1 entry without a name cannot get a unique_id."""
+    result, updates = _migrate(1, {}, unique_id=None)
+    assert result is False
+    assert updates is None
+
+
+def test_migrate_from_version_2():
+    """Version 2 entries pick their control method from the stored entities."""
+    data = {"name": "Blind", CONF_COVER_ENTITY_ID: "cover.blind"}
+    result, updates = _migrate(2, data)
+    assert result is True
+    assert "unique_id" not in updates
+    assert updates["data"] == {
+        **data,
+        CONF_CONTROL_METHOD: CONTROL_METHOD_EXISTING_COVER,
+        CONF_DEVICE_CLASS: "",
+    }
+
+
+def test_migrate_from_version_3():
+    """Version 3 entries only gain an empty device class."""
+    data = {**SWITCH_DATA, CONF_CONTROL_METHOD: CONTROL_METHOD_SWITCHES}
+    result, updates = _migrate(3, data)
+    assert result is True
+    assert updates == {
+        "data": {**data, CONF_DEVICE_CLASS: ""},
+        "version": CURRENT_CONFIG_VERSION,
+    }
+
+
+def test_migrate_current_version_is_noop():
+    """Entries already at the current version are left alone."""
+    result, updates = _migrate(CURRENT_CONFIG_VERSION, dict(SWITCH_DATA))
+    assert result is True
+    assert updates is None
+
+
+def test_migrate_unsupported_version():
+    """Versions without a migrator fail instead of raising."""
+    result, updates = _migrate(0, dict(SWITCH_DATA))
+    assert result is False
+    assert updates is None